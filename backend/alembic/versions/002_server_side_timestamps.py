@@ -0,0 +1,41 @@
+"""Server-side timestamps - let Postgres fill created_at/updated_at.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for column in ('created_at', 'updated_at'):
+        op.alter_column(
+            'item',
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.func.now(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    for column in ('created_at', 'updated_at'):
+        op.alter_column(
+            'item',
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=None,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
@@ -0,0 +1,22 @@
+"""Drop ix_item_id - the primary key already indexes item.id.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f('ix_item_id'), table_name='item')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_item_id'), 'item', ['id'], unique=False)
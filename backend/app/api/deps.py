@@ -1,8 +1,9 @@
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-from app.database import get_session
+from app.database import get_read_engine, get_session
 
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+ReadEngineDep = Annotated[AsyncEngine, Depends(get_read_engine)]
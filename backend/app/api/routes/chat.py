@@ -1,7 +1,7 @@
 """Chat API routes for AI assistant integration."""
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.config import settings
 from app.services.chat import ChatService
@@ -18,7 +18,7 @@ class ChatMessage(BaseModel):
 class ChatResponse(BaseModel):
     """Response model for chat messages."""
     response: str
-    tool_calls: list[dict] = []
+    tool_calls: list[dict] = Field(default_factory=list)
 
 
 @router.post("", response_model=ChatResponse)
@@ -1,15 +1,20 @@
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+# Static payloads are serialized once at import time
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "app-backend"})
+_ROOT_BYTES = orjson.dumps({"message": "Welcome to the App Template API"})
+
 
 @router.get("/health")
-async def health_check() -> dict:
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy", "service": "app-backend"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @router.get("/")
-async def root() -> dict:
+async def root() -> Response:
     """Root endpoint."""
-    return {"message": "Welcome to the App Template API"}
+    return Response(content=_ROOT_BYTES, media_type="application/json")
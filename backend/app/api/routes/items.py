@@ -4,45 +4,135 @@ Items API routes.
 Demonstrates CRUD operations with SQLModel and proper typing.
 """
 
+import hashlib
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query
+from cachetools import TTLCache
+from fastapi import APIRouter, Body, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import delete, update
 from sqlmodel import select
 
-from app.api.deps import SessionDep
+from app.api.deps import ReadEngineDep, SessionDep
+from app.config import settings
 from app.models import Item, ItemCreate, ItemRead, ItemUpdate
 
 router = APIRouter(prefix="/items", tags=["items"])
 
+MAX_BULK_ITEMS = 500
 
-@router.get("", response_model=list[ItemRead])
+_ITEM_READ_COLUMNS = tuple(getattr(Item, name) for name in ItemRead.model_fields)
+
+# Rows come straight from the database, so serialize them without revalidating
+_ITEM_LIST_ADAPTER = TypeAdapter(list[ItemRead])
+
+# Serialized pages of list_items and their ETags keyed on (skip, limit);
+# cleared on every mutation
+_list_cache: TTLCache[tuple[int, int], tuple[bytes, str]] = TTLCache(
+    maxsize=256, ttl=30
+)
+
+# Clients may keep a copy but must revalidate it with If-None-Match
+_CACHE_CONTROL = "no-cache"
+
+
+def _invalidate_list_cache() -> None:
+    _list_cache.clear()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Weak If-None-Match comparison against the current ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=304, headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    )
+
+
+@router.get("", response_model=None, responses={200: {"model": list[ItemRead]}})
 async def list_items(
-    session: SessionDep,
+    request: Request,
+    read_engine: ReadEngineDep,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-) -> list[Item]:
+) -> Response:
     """List all items with pagination."""
-    statement = select(Item).offset(skip).limit(limit)
-    result = await session.execute(statement)
-    return result.scalars().all()
+    key = (skip, limit)
+    cached = _list_cache.get(key) if settings.items_cache_enabled else None
+
+    if cached is None:
+        # Select plain columns so rows skip ORM instantiation and the identity map
+        statement = select(*_ITEM_READ_COLUMNS).offset(skip).limit(limit)
+        async with read_engine.connect() as conn:
+            result = await conn.execute(statement)
+            items = [ItemRead.model_construct(**row._mapping) for row in result]
+        content = _ITEM_LIST_ADAPTER.dump_json(items)
+        etag = f'W/"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+        if settings.items_cache_enabled:
+            _list_cache[key] = (content, etag)
+    else:
+        content, etag = cached
+
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL},
+    )
 
 
 @router.post("", response_model=ItemRead, status_code=201)
 async def create_item(session: SessionDep, item_in: ItemCreate) -> Item:
     """Create a new item."""
     item = Item.model_validate(item_in)
+    # The flush is a single INSERT ... RETURNING that fills in the server-side
+    # timestamps, so no refresh SELECT is needed afterwards
     session.add(item)
     await session.commit()
-    await session.refresh(item)
+    _invalidate_list_cache()
     return item
 
 
+@router.post("/bulk", response_model=list[ItemRead], status_code=201)
+async def create_items_bulk(
+    session: SessionDep,
+    items_in: Annotated[list[ItemCreate], Body(min_length=1, max_length=MAX_BULK_ITEMS)],
+) -> list[Item]:
+    """Create several items in a single transaction."""
+    items = [Item.model_validate(item_in) for item_in in items_in]
+    session.add_all(items)
+    await session.commit()
+    _invalidate_list_cache()
+    return items
+
+
 @router.get("/{item_id}", response_model=ItemRead)
-async def get_item(session: SessionDep, item_id: UUID) -> Item:
+async def get_item(
+    request: Request, response: Response, read_engine: ReadEngineDep, item_id: UUID
+) -> ItemRead | Response:
     """Get a specific item by ID."""
-    item = await session.get(Item, item_id)
-    if not item:
+    statement = select(*_ITEM_READ_COLUMNS).where(Item.id == item_id)
+    async with read_engine.connect() as conn:
+        row = (await conn.execute(statement)).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Item not found")
+    item = ItemRead.model_construct(**row._mapping)
+
+    etag = f'W/"{item.updated_at.timestamp()}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
     return item
 
 
@@ -51,26 +141,37 @@ async def update_item(
     session: SessionDep, item_id: UUID, item_in: ItemUpdate
 ) -> Item:
     """Update an item."""
-    item = await session.get(Item, item_id)
+    # A single UPDATE ... RETURNING replaces the load/mutate/refresh round trips;
+    # nothing is loaded in the session, so skip synchronizing its identity map
+    update_data = item_in.model_dump(exclude_unset=True)
+    statement = (
+        update(Item)
+        .where(Item.id == item_id)
+        .values(**update_data)
+        .returning(Item)
+        .execution_options(synchronize_session=False)
+    )
+    item = (await session.execute(statement)).scalar_one_or_none()
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
 
-    update_data = item_in.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(item, key, value)
-
-    session.add(item)
     await session.commit()
-    await session.refresh(item)
+    _invalidate_list_cache()
     return item
 
 
 @router.delete("/{item_id}", status_code=204)
 async def delete_item(session: SessionDep, item_id: UUID) -> None:
     """Delete an item."""
-    item = await session.get(Item, item_id)
-    if not item:
+    statement = (
+        delete(Item)
+        .where(Item.id == item_id)
+        .returning(Item.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted_id = (await session.execute(statement)).scalar_one_or_none()
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Item not found")
 
-    await session.delete(item)
     await session.commit()
+    _invalidate_list_cache()
@@ -1,27 +1,62 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlmodel import SQLModel
 
 from app.config import settings
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.is_development,
-    future=True,
-)
 
-async_session = sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=settings.database_echo,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=False,
+        query_cache_size=1200,
+        connect_args={
+            # Server-side prepared statements reused across sessions on a connection
+            "prepared_statement_cache_size": 512,
+            # JIT compilation costs more than it saves on short OLTP queries.
+            # uuid and timestamptz already travel in asyncpg's native binary codecs.
+            "server_settings": {"application_name": "poche", "jit": "off"},
+        },
+    )
+
+
+engine = _create_engine(settings.database_url)
+
+# Reads go to a replica when one is configured, otherwise they share the primary
+read_engine = (
+    _create_engine(settings.read_database_url)
+    if settings.read_database_url
+    else engine
 )
 
+async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+# Autocommit skips the BEGIN/ROLLBACK pair that a session wraps around every read
+autocommit_read_engine = read_engine.execution_options(isolation_level="AUTOCOMMIT")
+
 
 async def get_session() -> AsyncSession:
     async with async_session() as session:
         yield session
 
 
+def get_read_engine() -> AsyncEngine:
+    """Engine for read-only Core queries, routed to the read replica if configured.
+
+    Handlers connect only when they actually query, so cache hits and
+    request validation errors never check out a pooled connection.
+    """
+    return autocommit_read_engine
+
+
 async def init_db() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
@@ -1,12 +1,15 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
-from app.logging_config import setup_logging
+from app.logging_config import setup_logging, shutdown_logging
 from app.api.routes import chat, health, items
+from app.services.chat import close_db_pool, open_db_pool
 
 # Setup logging before anything else
 setup_logging()
@@ -17,9 +20,15 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Application starting up")
+    # Tasks that finish without suspending (e.g. the scene tools started by
+    # ChatService) complete inline instead of going through the scheduler
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    await open_db_pool()
     yield
     # Shutdown
     logger.info("Application shutting down")
+    await close_db_pool()
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -27,15 +36,17 @@ app = FastAPI(
     description="AI-assisted application template backend",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware
+# CORS middleware - explicit lists let preflight responses be built once at
+# startup instead of echoing the requested headers on every request
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://frontend:5173"],
+    allow_origins=frozenset({"http://localhost:5173", "http://frontend:5173"}),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["content-type", "authorization"],
 )
 
 # Include routers
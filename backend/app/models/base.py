@@ -1,11 +1,30 @@
 """Base model with common fields for all database models."""
 
+import os
+import time
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
+from sqlalchemy import DateTime, func
 from sqlmodel import SQLModel, Field
 
 
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The leading 48 bits are the Unix timestamp in milliseconds, so new
+    primary keys land at the right edge of the B-tree index.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10))
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | rand
+    # Version 7 in bits 48-51, RFC 4122 variant in bits 64-65
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return UUID(int=value)
+
+
 class BaseModel(SQLModel):
     """
     Base model that provides common fields for all database models.
@@ -17,25 +36,28 @@ class BaseModel(SQLModel):
             name: str
 
     This gives you:
-    - id: UUID primary key (auto-generated)
+    - id: UUID primary key (auto-generated, time-ordered UUIDv7)
     - created_at: Timestamp when record was created
     - updated_at: Timestamp when record was last updated
     """
 
     id: UUID = Field(
-        default_factory=uuid4,
+        default_factory=uuid7,
         primary_key=True,
-        index=True,
         nullable=False,
     )
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    # Timestamps are filled in by Postgres; they are fetched back via RETURNING
+    created_at: datetime | None = Field(
+        default=None,
         nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
     )
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    updated_at: datetime | None = Field(
+        default=None,
         nullable=False,
-        sa_column_kwargs={"onupdate": datetime.utcnow},
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
 
 
@@ -1,34 +1,123 @@
 """Chat service using OpenAI with function calling for tool integration."""
 
-import json
+import asyncio
+import inspect
 import logging
 import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
 import asyncpg
-import httpx
+import orjson
+from cachetools import TTLCache
 from openai import AsyncOpenAI
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Database connection pool
+# Database connection pool, opened by the app lifespan or on first use
 _db_pool: asyncpg.Pool | None = None
+_db_pool_lock = asyncio.Lock()
 
 
-async def get_db_pool() -> asyncpg.Pool:
-    """Get or create database connection pool."""
+async def _create_db_pool() -> asyncpg.Pool:
+    # Convert SQLAlchemy URL to asyncpg format
+    db_url = settings.database_url.replace("postgresql+asyncpg://", "postgresql://")
+    return await asyncpg.create_pool(
+        db_url,
+        min_size=settings.db_pool_min,
+        max_size=settings.db_pool_max,
+        statement_cache_size=1024,
+        max_inactive_connection_lifetime=300,
+        command_timeout=60,
+    )
+
+
+async def open_db_pool() -> None:
+    """Warm the database connection pool used by the db_* tools.
+
+    If Postgres is unreachable the app still starts and the pool is created
+    on the first db_* tool call instead.
+    """
+    global _db_pool
+    try:
+        _db_pool = await _create_db_pool()
+    except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as e:
+        logger.warning(f"Database pool not opened at startup, connecting lazily: {e}")
+
+
+async def _get_db_pool() -> asyncpg.Pool:
+    """Return the pool, creating it if startup could not."""
     global _db_pool
     if _db_pool is None:
-        # Convert SQLAlchemy URL to asyncpg format
-        db_url = settings.database_url.replace("postgresql+asyncpg://", "postgresql://")
-        _db_pool = await asyncpg.create_pool(db_url)
+        async with _db_pool_lock:
+            if _db_pool is None:
+                _db_pool = await _create_db_pool()
     return _db_pool
 
 
-# Define the tools available for function calling
-TOOLS = [
+async def close_db_pool() -> None:
+    """Close the database connection pool."""
+    global _db_pool
+    if _db_pool is not None:
+        await _db_pool.close()
+        _db_pool = None
+
+
+class _TurnConnection:
+    """A pool connection acquired on first use and shared for one chat turn."""
+
+    def __init__(self):
+        self.conn: asyncpg.Connection | None = None
+        # Tools in a turn run concurrently, but a connection runs one query at a time
+        self.lock = asyncio.Lock()
+
+    async def release(self) -> None:
+        async with self.lock:
+            if self.conn is not None:
+                await _db_pool.release(self.conn)
+                self.conn = None
+
+
+# Set by ChatService.chat so its db_* tools reuse one connection (and its
+# prepared-statement cache) instead of acquiring from the pool per call
+_turn_connection: ContextVar[_TurnConnection | None] = ContextVar(
+    "_turn_connection", default=None
+)
+
+
+@asynccontextmanager
+async def _db_connection():
+    """Yield the current chat turn's connection, or a pooled one outside a turn."""
+    turn = _turn_connection.get()
+    if turn is None:
+        async with (await _get_db_pool()).acquire() as conn:
+            yield conn
+        return
+    async with turn.lock:
+        if turn.conn is None:
+            turn.conn = await (await _get_db_pool()).acquire()
+        yield turn.conn
+
+
+# Catalog lookups for the db_* tools; the schema rarely changes at runtime
+_schema_cache: TTLCache[tuple[str, ...], dict] = TTLCache(maxsize=256, ttl=60)
+
+# Rows returned to the model by db_execute_query
+QUERY_ROW_LIMIT = 50
+
+_HTTP_METHODS = frozenset({"get", "post", "put", "patch", "delete"})
+
+# Endpoint summary built once from the app's own OpenAPI schema
+_api_endpoints: list[dict] | None = None
+
+
+# Define the tools available for function calling; a tuple so the shared
+# spec sent on every completion request can't be mutated between calls
+TOOLS = (
     {
         "type": "function",
         "function": {
@@ -265,7 +354,64 @@ TOOLS = [
             },
         },
     },
-]
+)
+
+SYSTEM_PROMPT = (
+    "You are an AI assistant for a 3D CAD application called Poche. "
+    "You can CREATE 3D geometry in the scene! When users ask you to create, draw, or make shapes "
+    "(boxes, cubes, rectangles, etc.), use the create_box or create_rectangle tools. "
+    "Dimensions are in inches. A typical room might be 120x120 inches (10x10 feet). "
+    "When asked to create a 'red box', use color '#ff0000'. "
+    "You can also query the database, check API endpoints, and clear the scene. "
+    "Be concise in your responses."
+)
+
+# Shared by every conversation; treat as read-only
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+# Parameter defaults per tool, taken from the schemas the model sees
+_TOOL_DEFAULTS: dict[str, dict[str, Any]] = {
+    tool["function"]["name"]: {
+        name: spec["default"]
+        for name, spec in tool["function"]["parameters"]["properties"].items()
+        if "default" in spec
+    }
+    for tool in TOOLS
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SceneAction:
+    """Result of a scene tool: an action for the frontend to execute."""
+
+    action: str
+    params: dict[str, Any]
+    message: str
+    success: bool = True
+
+
+def _scene_tool(name: str, message: str):
+    """Build a handler that returns a scene action for the frontend to execute."""
+    defaults = _TOOL_DEFAULTS[name]
+
+    def handler(**arguments: Any) -> SceneAction:
+        return SceneAction(name, {**defaults, **arguments}, message)
+
+    return handler
+
+
+def _ack_message(results: list[SceneAction]) -> str:
+    """Summarize successful scene tool results without asking the model."""
+    return " ".join(f"{result.message}." for result in results)
+
+
+def _parse_arguments(raw: str) -> dict[str, Any]:
+    """Decode a tool call's JSON arguments, falling back to no arguments."""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return {}
 
 
 class ChatService:
@@ -273,179 +419,241 @@ class ChatService:
 
     def __init__(self):
         self.client = AsyncOpenAI(api_key=settings.openai_api_key)
-        self.api_url = "http://localhost:8000"  # Internal API URL
         self.model = "gpt-5-mini"
+        # Tool name -> handler; handlers take the tool's arguments as keywords
+        self._dispatch = {
+            # Scene manipulation tools - return actions for frontend to execute
+            "create_box": _scene_tool("create_box", "Box created"),
+            "create_rectangle": _scene_tool("create_rectangle", "Rectangle created"),
+            "create_terrain": _scene_tool("create_terrain", "Terrain created"),
+            "clear_scene": _scene_tool("clear_scene", "Scene cleared"),
+            "api_list_endpoints": self._api_list_endpoints,
+            "api_health_check": self._api_health_check,
+            "db_list_tables": self._db_list_tables,
+            "db_describe_table": self._db_describe_table,
+            "db_execute_query": self._db_execute_query,
+            "db_get_schema": self._db_get_schema,
+        }
 
-    async def _execute_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict:
+    async def _execute_tool(
+        self, tool_name: str, arguments: dict[str, Any]
+    ) -> dict | SceneAction:
         """Execute a tool and return the result."""
+        handler = self._dispatch.get(tool_name)
+        if handler is None:
+            return {"error": f"Unknown tool: {tool_name}"}
         try:
-            # Scene manipulation tools - return actions for frontend to execute
-            if tool_name == "create_box":
-                return {
-                    "action": "create_box",
-                    "params": {
-                        "x": arguments.get("x", 0),
-                        "y": arguments.get("y", 0),
-                        "z": arguments.get("z", 0),
-                        "width": arguments.get("width", 24),
-                        "height": arguments.get("height", 24),
-                        "depth": arguments.get("depth", 24),
-                        "color": arguments.get("color", "#4a90d9"),
-                    },
-                    "success": True,
-                    "message": "Box created",
-                }
-            elif tool_name == "create_rectangle":
-                return {
-                    "action": "create_rectangle",
-                    "params": {
-                        "x": arguments.get("x", 0),
-                        "z": arguments.get("z", 0),
-                        "width": arguments.get("width", 48),
-                        "depth": arguments.get("depth", 48),
-                        "color": arguments.get("color", "#4a90d9"),
-                    },
-                    "success": True,
-                    "message": "Rectangle created",
-                }
-            elif tool_name == "create_terrain":
-                return {
-                    "action": "create_terrain",
-                    "params": {
-                        "width": arguments.get("width", 208),
-                        "depth": arguments.get("depth", 208),
-                        "terrain_type": arguments.get("terrain_type", "sloped"),
-                        "max_height": arguments.get("max_height", 30),
-                        "cliff_side": arguments.get("cliff_side", "south"),
-                        "resolution": arguments.get("resolution", 12),
-                    },
-                    "success": True,
-                    "message": "Terrain created",
-                }
-            elif tool_name == "clear_scene":
-                return {
-                    "action": "clear_scene",
-                    "params": {},
-                    "success": True,
-                    "message": "Scene cleared",
-                }
-            # Database/API tools
-            elif tool_name == "api_list_endpoints":
-                return await self._api_list_endpoints()
-            elif tool_name == "api_health_check":
-                return await self._api_health_check()
-            elif tool_name == "db_list_tables":
-                return await self._db_list_tables(arguments.get("schema", "public"))
-            elif tool_name == "db_describe_table":
-                return await self._db_describe_table(
-                    arguments["table_name"],
-                    arguments.get("schema", "public")
-                )
-            elif tool_name == "db_execute_query":
-                return await self._db_execute_query(arguments["query"])
-            elif tool_name == "db_get_schema":
-                return await self._db_get_schema()
-            else:
-                return {"error": f"Unknown tool: {tool_name}"}
+            result = handler(**arguments)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
         except Exception as e:
             logger.error(f"Tool execution failed: {e}")
             return {"error": str(e)}
 
+    # Database/API tools
+
     async def _api_list_endpoints(self) -> dict:
         """List all API endpoints."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{self.api_url}/openapi.json")
-            schema = response.json()
-
-        endpoints = []
-        for path, methods in schema.get("paths", {}).items():
-            for method, details in methods.items():
-                if method in ["get", "post", "put", "patch", "delete"]:
-                    endpoints.append({
-                        "path": path,
-                        "method": method.upper(),
-                        "summary": details.get("summary", ""),
-                    })
-        return {"endpoints": endpoints}
+        # The tools run inside the API process, so read the schema directly
+        # instead of fetching /openapi.json over loopback HTTP
+        global _api_endpoints
+        if _api_endpoints is None:
+            from app.main import app
+
+            _api_endpoints = [
+                {
+                    "path": path,
+                    "method": method.upper(),
+                    "summary": details.get("summary", ""),
+                }
+                for path, methods in app.openapi().get("paths", {}).items()
+                for method, details in methods.items()
+                if method in _HTTP_METHODS
+            ]
+        return {"endpoints": _api_endpoints}
 
     async def _api_health_check(self) -> dict:
         """Check API health."""
-        start = time.time()
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{self.api_url}/health")
-            elapsed = time.time() - start
-            return {
-                "status": "healthy" if response.status_code == 200 else "unhealthy",
-                "response_time_ms": round(elapsed * 1000, 2),
-            }
+        from app.api.routes.health import health_check
+
+        start = time.perf_counter()
+        response = await health_check()
+        elapsed = time.perf_counter() - start
+        return {
+            "status": "healthy" if response.status_code == 200 else "unhealthy",
+            "response_time_ms": round(elapsed * 1000, 2),
+        }
 
     async def _db_list_tables(self, schema: str = "public") -> dict:
         """List database tables."""
-        pool = await get_db_pool()
-        async with pool.acquire() as conn:
+        key = ("tables", schema)
+        if (cached := _schema_cache.get(key)) is not None:
+            return cached
+
+        async with _db_connection() as conn:
             rows = await conn.fetch(
                 """
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = $1 AND table_type = 'BASE TABLE'
-                ORDER BY table_name
+                SELECT c.relname
+                FROM pg_catalog.pg_class c
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = $1 AND c.relkind IN ('r', 'p')
+                ORDER BY c.relname
                 """,
                 schema,
             )
-            return {"tables": [row["table_name"] for row in rows]}
+            result = {"tables": [row["relname"] for row in rows]}
+            _schema_cache[key] = result
+            return result
 
     async def _db_describe_table(self, table_name: str, schema: str = "public") -> dict:
         """Describe a database table."""
-        pool = await get_db_pool()
-        async with pool.acquire() as conn:
-            columns = await conn.fetch(
+        key = ("describe", schema, table_name)
+        if (cached := _schema_cache.get(key)) is not None:
+            return cached
+
+        async with _db_connection() as conn:
+            columns = await conn.fetchval(
                 """
-                SELECT column_name, data_type, is_nullable
-                FROM information_schema.columns
-                WHERE table_schema = $1 AND table_name = $2
-                ORDER BY ordinal_position
+                SELECT json_agg(
+                    json_build_object(
+                        'column_name', a.attname,
+                        'data_type', format_type(a.atttypid, a.atttypmod),
+                        'is_nullable', CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END
+                    )
+                    ORDER BY a.attnum
+                )
+                FROM pg_catalog.pg_attribute a
+                JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = $1 AND c.relname = $2
+                    AND a.attnum > 0 AND NOT a.attisdropped
                 """,
                 schema,
                 table_name,
             )
-            return {
+            result = {
                 "table_name": table_name,
-                "columns": [dict(c) for c in columns],
+                "columns": orjson.loads(columns) if columns else [],
             }
+            _schema_cache[key] = result
+            return result
 
     async def _db_execute_query(self, query: str) -> dict:
         """Execute a read-only SQL query."""
-        query_upper = query.strip().upper()
-        if not query_upper.startswith("SELECT") and not query_upper.startswith("WITH"):
-            return {"error": "Only SELECT queries are allowed"}
-
-        pool = await get_db_pool()
-        async with pool.acquire() as conn:
-            rows = await conn.fetch(query)
+        # Postgres rejects any write inside a read-only transaction, which
+        # also covers data-modifying CTEs a prefix check would let through
+        async with _db_connection() as conn:
+            try:
+                async with conn.transaction(readonly=True):
+                    # Postgres stops after one row past the limit and encodes
+                    # the rows as a single JSON array, so no per-row Records
+                    # are built client-side. The newline keeps a trailing
+                    # -- comment in the query from swallowing the paren.
+                    data = await conn.fetchval(
+                        "SELECT json_agg(t) FROM "
+                        f"(SELECT * FROM ({query.rstrip().rstrip(';')}\n) q LIMIT $1) t",
+                        QUERY_ROW_LIMIT + 1,
+                    )
+            except asyncpg.ReadOnlySQLTransactionError:
+                return {"error": "Only read-only queries are allowed"}
+            rows = orjson.loads(data) if data else []
+            # row_count is capped at QUERY_ROW_LIMIT + 1 for truncated results
             return {
                 "row_count": len(rows),
-                "data": [dict(row) for row in rows[:50]],
-                "truncated": len(rows) > 50,
+                "data": rows[:QUERY_ROW_LIMIT],
+                "truncated": len(rows) > QUERY_ROW_LIMIT,
             }
 
     async def _db_get_schema(self) -> dict:
         """Get complete database schema."""
-        pool = await get_db_pool()
-        async with pool.acquire() as conn:
-            tables = await conn.fetch(
+        key = ("schema",)
+        if (cached := _schema_cache.get(key)) is not None:
+            return cached
+
+        async with _db_connection() as conn:
+            tables = await conn.fetchval(
                 """
-                SELECT
-                    t.table_name,
-                    array_agg(c.column_name || ' ' || c.data_type ORDER BY c.ordinal_position) as columns
-                FROM information_schema.tables t
-                JOIN information_schema.columns c
-                    ON t.table_name = c.table_name AND t.table_schema = c.table_schema
-                WHERE t.table_schema = 'public' AND t.table_type = 'BASE TABLE'
-                GROUP BY t.table_name
-                ORDER BY t.table_name
+                SELECT json_object_agg(relname, columns ORDER BY relname)
+                FROM (
+                    SELECT
+                        c.relname,
+                        array_agg(
+                            a.attname || ' ' || format_type(a.atttypid, a.atttypmod)
+                            ORDER BY a.attnum
+                        ) AS columns
+                    FROM pg_catalog.pg_class c
+                    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                    JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid
+                    WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p')
+                        AND a.attnum > 0 AND NOT a.attisdropped
+                    GROUP BY c.relname
+                ) t
                 """
             )
-            return {"tables": {t["table_name"]: t["columns"] for t in tables}}
+            result = {"tables": orjson.loads(tables) if tables else {}}
+            _schema_cache[key] = result
+            return result
+
+    def _start_tool(self, call: dict[str, Any], arguments: dict[str, Any]) -> None:
+        """Schedule a streamed tool call once its arguments are known."""
+        logger.info(f"Calling tool: {call['name']} with args: {arguments}")
+        call["parsed"] = arguments
+        call["task"] = asyncio.create_task(self._execute_tool(call["name"], arguments))
+
+    async def _stream_turn(
+        self, messages: list[dict[str, Any]]
+    ) -> tuple[str | None, list[dict[str, Any]]]:
+        """
+        Stream one completion, starting each tool call as soon as its
+        arguments are complete so tools run while the model is still
+        generating the rest of the response.
+
+        Returns:
+            The assistant's text (if any) and the tool calls in the order the
+            model issued them, each holding a task that resolves to its result
+        """
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            tools=TOOLS,
+            tool_choice="auto",
+            stream=True,
+        )
+
+        content: list[str] = []
+        calls: dict[int, dict[str, Any]] = {}
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content.append(delta.content)
+            for fragment in delta.tool_calls or ():
+                call = calls.get(fragment.index)
+                if call is None:
+                    call = calls[fragment.index] = {
+                        "id": "", "name": "", "arguments": "", "task": None,
+                    }
+                if fragment.id:
+                    call["id"] = fragment.id
+                if fragment.function is not None:
+                    call["name"] += fragment.function.name or ""
+                    call["arguments"] += fragment.function.arguments or ""
+                if call["task"] is None and call["arguments"]:
+                    try:
+                        arguments = orjson.loads(call["arguments"])
+                    except orjson.JSONDecodeError:
+                        continue
+                    self._start_tool(call, arguments)
+
+        # Calls whose arguments never parsed run with none, as before
+        ordered = [calls[index] for index in sorted(calls)]
+        for call in ordered:
+            if call["task"] is None:
+                self._start_tool(call, _parse_arguments(call["arguments"]))
+
+        return "".join(content) or None, ordered
 
     async def chat(
         self,
@@ -462,20 +670,7 @@ class ChatService:
         Returns:
             Response containing the assistant's reply and any tool calls made
         """
-        messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You are an AI assistant for a 3D CAD application called Poche. "
-                    "You can CREATE 3D geometry in the scene! When users ask you to create, draw, or make shapes "
-                    "(boxes, cubes, rectangles, etc.), use the create_box or create_rectangle tools. "
-                    "Dimensions are in inches. A typical room might be 120x120 inches (10x10 feet). "
-                    "When asked to create a 'red box', use color '#ff0000'. "
-                    "You can also query the database, check API endpoints, and clear the scene. "
-                    "Be concise in your responses."
-                ),
-            }
-        ]
+        messages = [_SYSTEM_MESSAGE]
 
         if conversation_history:
             messages.extend(conversation_history)
@@ -485,54 +680,63 @@ class ChatService:
         tool_calls_made = []
         max_iterations = 5  # Prevent infinite loops
 
-        for _ in range(max_iterations):
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                tools=TOOLS,
-                tool_choice="auto",
-            )
-
-            assistant_message = response.choices[0].message
-
-            # If no tool calls, we're done
-            if not assistant_message.tool_calls:
-                return {
-                    "response": assistant_message.content,
-                    "tool_calls": tool_calls_made,
-                }
-
-            # Add assistant message to history
-            messages.append(assistant_message.model_dump())
+        turn = _TurnConnection()
+        token = _turn_connection.set(turn)
+        try:
+            for _ in range(max_iterations):
+                content, calls = await self._stream_turn(messages)
 
-            # Process each tool call
-            for tool_call in assistant_message.tool_calls:
-                function_name = tool_call.function.name
-                try:
-                    arguments = json.loads(tool_call.function.arguments)
-                except json.JSONDecodeError:
-                    arguments = {}
+                # If no tool calls, we're done
+                if not calls:
+                    return {
+                        "response": content,
+                        "tool_calls": tool_calls_made,
+                    }
 
-                logger.info(f"Calling tool: {function_name} with args: {arguments}")
+                # Add assistant message to history
+                messages.append({
+                    "role": "assistant",
+                    "content": content,
+                    "tool_calls": [
+                        {
+                            "id": call["id"],
+                            "type": "function",
+                            "function": {"name": call["name"], "arguments": call["arguments"]},
+                        }
+                        for call in calls
+                    ],
+                })
 
-                # Execute the tool directly
-                result = await self._execute_tool(function_name, arguments)
+                # Record results in the order the model issued the calls
+                results = [await call["task"] for call in calls]
+                for call, result in zip(calls, results):
+                    tool_calls_made.append({
+                        "tool": call["name"],
+                        "arguments": call["parsed"],
+                        "result": result,
+                    })
 
-                tool_calls_made.append({
-                    "tool": function_name,
-                    "arguments": arguments,
-                    "result": result,
-                })
+                    # Add tool result to messages
+                    messages.append({
+                        "role": "tool",
+                        "tool_call_id": call["id"],
+                        "content": orjson.dumps(result).decode(),
+                    })
 
-                # Add tool result to messages
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "content": json.dumps(result),
-                })
+                # Scene tools just hand actions to the frontend, so once they have
+                # all succeeded another model round trip would only produce an
+                # acknowledgement
+                if all(isinstance(result, SceneAction) for result in results):
+                    return {
+                        "response": content or _ack_message(results),
+                        "tool_calls": tool_calls_made,
+                    }
 
-        # If we hit max iterations, return what we have
-        return {
-            "response": "I've made several tool calls. Here's what I found.",
-            "tool_calls": tool_calls_made,
-        }
+            # If we hit max iterations, return what we have
+            return {
+                "response": "I've made several tool calls. Here's what I found.",
+                "tool_calls": tool_calls_made,
+            }
+        finally:
+            _turn_connection.reset(token)
+            await turn.release()
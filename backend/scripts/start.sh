@@ -5,4 +5,4 @@ echo "Running database migrations..."
 alembic upgrade head
 
 echo "Starting server..."
-exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
+exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --reload
@@ -15,3 +15,41 @@ async def test_root(client):
     assert response.status_code == 200
     data = response.json()
     assert "message" in data
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_rejects_oversized_batch(client):
+    items = [{"name": f"item-{i}", "price": 1.0} for i in range(501)]
+    response = await client.post("/items/bulk", json=items)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_cors_preflight(client):
+    response = await client.options(
+        "/items",
+        headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+
+
+@pytest.mark.asyncio
+async def test_list_items_cache_hit_skips_database(client, monkeypatch):
+    from app.api.routes import items
+
+    monkeypatch.setattr(items, "_list_cache", {(0, 100): (b"[]", 'W/"cached"')})
+    response = await client.get("/items")
+    assert response.status_code == 200
+    assert response.json() == []
+    assert response.headers["etag"] == 'W/"cached"'
+
+
+@pytest.mark.asyncio
+async def test_get_item_rejects_invalid_id(client):
+    response = await client.get("/items/not-a-uuid")
+    assert response.status_code == 422
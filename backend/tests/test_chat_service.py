@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.config import settings
+from app.services.chat import ChatService
+
+
+def _tool_call(index: int, call_id: str, name: str, arguments: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        index=index,
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+def _chunk(content: str | None = None, tool_calls: list | None = None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+async def _stream(chunks: list):
+    for chunk in chunks:
+        yield chunk
+
+
+class _FakeCompletions:
+    def __init__(self, turns: list[list]):
+        self._turns = iter(turns)
+
+    async def create(self, **kwargs):
+        assert kwargs["stream"] is True
+        return _stream(next(self._turns))
+
+
+@pytest.fixture
+def make_service(monkeypatch):
+    monkeypatch.setattr(settings, "openai_api_key", "test-key")
+    return _service
+
+
+def _service(turns: list[list]) -> ChatService:
+    service = ChatService()
+    service.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=_FakeCompletions(turns))
+    )
+    return service
+
+
+@pytest.mark.asyncio
+async def test_chat_runs_tool_calls_in_order(make_service):
+    service = make_service([
+        [
+            _chunk(tool_calls=[_tool_call(0, "1", "create_box", '{"color": ')]),
+            _chunk(tool_calls=[_tool_call(0, None, None, '"#ff0000"}')]),
+            _chunk(tool_calls=[_tool_call(1, "2", "clear_scene", "not json")]),
+        ],
+    ])
+
+    result = await service.chat("make a red box then clear")
+
+    assert result["response"] == "Box created. Scene cleared."
+    assert [call["tool"] for call in result["tool_calls"]] == ["create_box", "clear_scene"]
+    assert result["tool_calls"][0]["result"].params["color"] == "#ff0000"
+    assert result["tool_calls"][1]["arguments"] == {}
+
+
+@pytest.mark.asyncio
+async def test_chat_asks_model_again_after_non_scene_tool(make_service):
+    service = make_service([
+        [_chunk(tool_calls=[_tool_call(0, "1", "nope", "{}")])],
+        [_chunk(content="Do"), _chunk(content="ne")],
+    ])
+
+    result = await service.chat("do something unknown")
+
+    assert result["response"] == "Done"
+    assert result["tool_calls"][0]["result"] == {"error": "Unknown tool: nope"}
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_reports_unknown_tool(make_service):
+    service = make_service([])
+
+    assert await service._execute_tool("nope", {}) == {"error": "Unknown tool: nope"}
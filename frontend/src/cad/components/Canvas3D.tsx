@@ -3,7 +3,7 @@
  * Provides the 3D viewport with camera controls and scene rendering.
  */
 
-import { Canvas } from '@react-three/fiber';
+import { Canvas, useFrame } from '@react-three/fiber';
 import { OrbitControls, GizmoHelper, GizmoViewport, Stats } from '@react-three/drei';
 import { Suspense } from 'react';
 import { MOUSE } from 'three';
@@ -44,6 +44,16 @@ function CameraControls() {
   );
 }
 
+// Flags the e2e test hook once the first frame is drawn
+function RendererReadyFlag() {
+  useFrame(() => {
+    if (window.__poche && !window.__poche.rendererReady) {
+      window.__poche.rendererReady = true;
+    }
+  });
+  return null;
+}
+
 export function Canvas3D({ showStats = false }: Canvas3DProps) {
   return (
     <div className="w-full h-full bg-gray-100">
@@ -59,8 +69,13 @@ export function Canvas3D({ showStats = false }: Canvas3DProps) {
           alpha: false,
           logarithmicDepthBuffer: true,
         }}
-        onCreated={({ gl }) => {
+        onCreated={({ gl, get }) => {
           gl.setClearColor('#f0f0f0');
+          if (window.__poche) {
+            window.__poche.resetView = () => {
+              (get().controls as { reset?: () => void } | null)?.reset?.();
+            };
+          }
         }}
       >
         <Suspense fallback={null}>
@@ -95,6 +110,8 @@ export function Canvas3D({ showStats = false }: Canvas3DProps) {
 
           {/* Performance stats */}
           {showStats && <Stats />}
+
+          {import.meta.env.DEV && <RendererReadyFlag />}
         </Suspense>
       </Canvas>
     </div>
@@ -1434,3 +1434,53 @@ export const useSnap = () =>
     gridSize: state.gridSize,
     snapEnabled: state.snapEnabled,
   }));
+
+// Test hook: e2e tests poll editor state here instead of scraping the status bar
+export interface SceneSnapshot {
+  vertexCount: number;
+  edgeCount: number;
+  faceCount: number;
+  activeTool: ToolType;
+}
+
+export interface PocheTestHook {
+  (): SceneSnapshot;
+  // Set once the first frame has been drawn
+  rendererReady: boolean;
+  // Clear geometry through the store, skipping the toolbar button
+  clear: () => void;
+  // Restore the initial scene so tests can reuse a loaded page
+  reset: () => void;
+  // Installed by the canvas to put the camera back
+  resetView?: () => void;
+}
+
+declare global {
+  interface Window {
+    __poche?: PocheTestHook;
+  }
+}
+
+if (import.meta.env.DEV) {
+  const initialState = useSceneStore.getState();
+
+  window.__poche = Object.assign(
+    (): SceneSnapshot => {
+      const state = useSceneStore.getState();
+      return {
+        vertexCount: state.vertices.size,
+        edgeCount: state.edges.size,
+        faceCount: state.faces.size,
+        activeTool: state.activeTool,
+      };
+    },
+    {
+      rendererReady: false,
+      clear: () => useSceneStore.getState().clearScene(),
+      reset: () => {
+        useSceneStore.setState(initialState, true);
+        window.__poche?.resetView?.();
+      },
+    }
+  );
+}
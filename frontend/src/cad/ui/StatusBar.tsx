@@ -93,9 +93,9 @@ export function StatusBar() {
       {/* Scene stats */}
       <div className="flex items-center gap-3 pl-4 border-l border-slate-600 text-slate-400">
         <Layers size={14} />
-        <span>{vertices.size} vertices</span>
-        <span>{edges.size} edges</span>
-        <span>{faces.size} faces</span>
+        <span data-testid="vertex-count">{vertices.size} vertices</span>
+        <span data-testid="edge-count">{edges.size} edges</span>
+        <span data-testid="face-count">{faces.size} faces</span>
         {selectedIds.size > 0 && (
           <span className="text-blue-400">{selectedIds.size} selected</span>
         )}
@@ -17,6 +17,9 @@ class Settings(BaseSettings):
     # Frontend
     frontend_url: str = "http://localhost:5173"
 
+    # Playwright: concurrent browser tool calls allowed at once
+    playwright_concurrency: int = 4
+
     # MCP Server
     mcp_port: int = 8080
 
@@ -1,10 +1,109 @@
 """FastAPI integration tools for the MCP server."""
 
+import asyncio
+import time
+
 import httpx
+import orjson
 from fastmcp import FastMCP
 
 from ..config import settings
 
+_client: httpx.AsyncClient | None = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client for the FastAPI backend."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=settings.fastapi_url,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=30.0,
+        )
+    return _client
+
+
+_HTTP_METHODS = frozenset({"get", "post", "put", "patch", "delete"})
+
+# The schema only changes on deploy; re-check it at most once per TTL
+OPENAPI_CACHE_TTL = 60.0
+
+# (fetched_at, etag, schema, endpoints)
+_openapi_cache: tuple[float, str | None, dict, list[dict]] | None = None
+_openapi_lock = asyncio.Lock()
+
+
+async def get_openapi() -> tuple[dict, list[dict]]:
+    """Get the backend's OpenAPI schema and endpoint list, cached in-process."""
+    global _openapi_cache
+    async with _openapi_lock:
+        now = time.monotonic()
+        if _openapi_cache and now - _openapi_cache[0] < OPENAPI_CACHE_TTL:
+            return _openapi_cache[2], _openapi_cache[3]
+
+        etag = _openapi_cache[1] if _openapi_cache else None
+        client = await get_client()
+        async with client.stream(
+            "GET", "/openapi.json", headers={"If-None-Match": etag} if etag else None
+        ) as response:
+            if response.status_code == 304 and _openapi_cache:
+                _openapi_cache = (now, *_openapi_cache[1:])
+                return _openapi_cache[2], _openapi_cache[3]
+
+            # Don't cache an error page as the schema for a whole TTL
+            response.raise_for_status()
+
+            # Collect the body chunks once and parse the bytes directly rather
+            # than buffering a decoded text copy for the stdlib json module
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body.extend(chunk)
+
+        schema = orjson.loads(body)
+        endpoints = [
+            {
+                "path": path,
+                "method": method.upper(),
+                "summary": details.get("summary", ""),
+                "description": details.get("description", ""),
+                "tags": details.get("tags", []),
+            }
+            for path, methods in schema.get("paths", {}).items()
+            for method, details in methods.items()
+            if method in _HTTP_METHODS
+        ]
+        _openapi_cache = (now, response.headers.get("etag"), schema, endpoints)
+
+        return _openapi_cache[2], _openapi_cache[3]
+
+
+async def _call_api(
+    method: str,
+    path: str,
+    body: dict | None = None,
+    query_params: dict | None = None,
+) -> dict:
+    """Send one request to the backend; shared by api_call and api_test."""
+    client = await get_client()
+    response = await client.request(
+        method=method.upper(),
+        url=path,
+        json=body,
+        params=query_params,
+    )
+
+    try:
+        response_body = response.json()
+    except Exception:
+        response_body = response.text
+
+    return {
+        "status_code": response.status_code,
+        "headers": dict(response.headers),
+        "body": response_body,
+    }
+
 
 def register_fastapi_tools(mcp: FastMCP) -> None:
     """Register all FastAPI tools with the MCP server."""
@@ -17,9 +116,8 @@ def register_fastapi_tools(mcp: FastMCP) -> None:
         Returns:
             Complete OpenAPI schema including endpoints, request/response schemas
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{settings.fastapi_url}/openapi.json")
-            return response.json()
+        schema, _ = await get_openapi()
+        return schema
 
     @mcp.tool
     async def api_list_endpoints() -> list[dict]:
@@ -29,23 +127,7 @@ def register_fastapi_tools(mcp: FastMCP) -> None:
         Returns:
             List of endpoints with path, method, summary, and tags
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{settings.fastapi_url}/openapi.json")
-            schema = response.json()
-
-        endpoints = []
-        for path, methods in schema.get("paths", {}).items():
-            for method, details in methods.items():
-                if method in ["get", "post", "put", "patch", "delete"]:
-                    endpoints.append(
-                        {
-                            "path": path,
-                            "method": method.upper(),
-                            "summary": details.get("summary", ""),
-                            "description": details.get("description", ""),
-                            "tags": details.get("tags", []),
-                        }
-                    )
+        _, endpoints = await get_openapi()
         return endpoints
 
     @mcp.tool
@@ -67,24 +149,7 @@ def register_fastapi_tools(mcp: FastMCP) -> None:
         Returns:
             Response data including status code, headers, and body
         """
-        async with httpx.AsyncClient(base_url=settings.fastapi_url) as client:
-            response = await client.request(
-                method=method.upper(),
-                url=path,
-                json=body,
-                params=query_params,
-            )
-
-            try:
-                response_body = response.json()
-            except Exception:
-                response_body = response.text
-
-            return {
-                "status_code": response.status_code,
-                "headers": dict(response.headers),
-                "body": response_body,
-            }
+        return await _call_api(method, path, body, query_params)
 
     @mcp.tool
     async def api_test(
@@ -109,7 +174,7 @@ def register_fastapi_tools(mcp: FastMCP) -> None:
         Returns:
             Test result with pass/fail status and details
         """
-        result = await api_call(method, path, body)
+        result = await _call_api(method, path, body)
 
         passed = True
         failures = []
@@ -143,23 +208,21 @@ def register_fastapi_tools(mcp: FastMCP) -> None:
         Returns:
             Health status including response time
         """
-        import time
-
+        client = await get_client()
         start = time.time()
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(f"{settings.fastapi_url}/health")
-                elapsed = time.time() - start
-                return {
-                    "status": "healthy",
-                    "status_code": response.status_code,
-                    "response_time_ms": round(elapsed * 1000, 2),
-                    "response": (
-                        response.json() if response.status_code == 200 else None
-                    ),
-                }
-            except Exception as e:
-                return {
-                    "status": "unhealthy",
-                    "error": str(e),
-                }
+        try:
+            response = await client.get("/health")
+            elapsed = time.time() - start
+            return {
+                "status": "healthy",
+                "status_code": response.status_code,
+                "response_time_ms": round(elapsed * 1000, 2),
+                "response": (
+                    response.json() if response.status_code == 200 else None
+                ),
+            }
+        except Exception as e:
+            return {
+                "status": "unhealthy",
+                "error": str(e),
+            }
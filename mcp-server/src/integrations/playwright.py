@@ -1,19 +1,114 @@
 """Playwright integration tools for the MCP server."""
 
+import asyncio
 import base64
+import contextlib
+import functools
+import itertools
 import os
-from datetime import datetime
+import time
+import zlib
+from collections import deque
+from typing import Any, Literal
+from urllib.parse import urljoin, urlsplit
 
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from fastmcp import FastMCP
+from pydantic import BaseModel, Field
+from selectolax.lexbor import LexborHTMLParser
 
 from ..config import settings
 
-# Global browser and page management
+# Global browser and page management; each page_id gets its own isolated
+# context so sessions don't share cookies/storage or contend on one context
 _browser: Browser | None = None
-_pages: dict[str, Page] = {}
+_contexts: dict[str, tuple[BrowserContext, Page]] = {}
+
+# Closed sessions kept warm for reuse, since creating a context and page
+# costs a Chromium target plus a CDP attach
+IDLE_PAGE_LIMIT = 8
+_idle_pages: deque[tuple[BrowserContext, Page]] = deque()
+# Origins each context has loaded a frame from since it was last reset
+_context_origins: dict[BrowserContext, set[str]] = {}
 
 SCREENSHOT_DIR = os.getenv("SCREENSHOT_DIR", "/tmp/screenshots")
+_screenshot_dir_ready = False
+# Disambiguates auto-generated screenshot names taken in the same nanosecond
+_shot_counter = itertools.count()
+
+# Page-side helpers installed once per context, so tool calls invoke them by
+# name instead of shipping the same selector code with every evaluate.
+# Namespaced apart from the app's own window.__poche hooks.
+HELPER_JS = """
+window.__pocheMcp = {
+    runAssertions(assertions) {
+        return assertions.map(({type, selector, value}) => {
+            try {
+                if (type === 'element_exists') {
+                    const found = document.querySelector(selector) !== null;
+                    return {passed: found, details: found ? 'Element found' : 'Element not found'};
+                }
+                if (type === 'text_contains') {
+                    const el = document.querySelector(selector);
+                    if (!el) return {passed: false, error: `Element not found: ${selector}`};
+                    const text = el.innerText;
+                    return {
+                        passed: text.includes(value),
+                        details: text.length > 100
+                            ? `Found: '${text.slice(0, 100)}...'`
+                            : `Found: '${text}'`,
+                    };
+                }
+                const count = document.querySelectorAll(selector).length;
+                return {passed: count === value, details: `Expected ${value}, found ${count}`};
+            } catch (e) {
+                return {passed: false, error: String(e)};
+            }
+        });
+    },
+};
+"""
+
+
+def _input_type(node) -> str:
+    """The DOM's el.type for an input, textarea, or select node."""
+    if node.tag == "textarea":
+        return "textarea"
+    if node.tag == "select":
+        return "select-multiple" if "multiple" in node.attributes else "select-one"
+    return (node.attributes.get("type") or "text").lower()
+
+
+def _extract_content(html: str, base_url: str) -> dict:
+    """Pull the title, visible text, and interactive elements out of page HTML."""
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(["script", "style", "noscript", "template"])
+    title = tree.css_first("title")
+    body = tree.body
+    return {
+        "title": title.text(strip=True) if title else "",
+        "text": body.text(separator="\n", strip=True)[:5000] if body else "",
+        "buttons": [
+            {"text": node.text(strip=True), "class": node.attributes.get("class") or ""}
+            for node in tree.css('button, [role="button"]')[:20]
+        ],
+        "links": [
+            {
+                "text": node.text(strip=True),
+                "href": urljoin(base_url, node.attributes["href"] or ""),
+            }
+            for node in tree.css("a[href]")[:20]
+        ],
+        "inputs": [
+            {
+                "type": _input_type(node),
+                "name": node.attributes.get("name") or "",
+                "id": node.attributes.get("id") or "",
+                "placeholder": node.attributes.get("placeholder") or "",
+            }
+            for node in tree.css("input, textarea, select")[:20]
+        ],
+    }
 
 
 async def get_browser() -> Browser:
@@ -27,38 +122,284 @@ async def get_browser() -> Browser:
     return _browser
 
 
+def _origin(url: str) -> str | None:
+    """Return url's scheme://host[:port], or None for about:blank and the like."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}" if parts.netloc else None
+
+
+def _record_origin(origins: set[str], url: str) -> None:
+    origin = _origin(url)
+    if origin:
+        origins.add(origin)
+
+
+async def _open_page(url: str | None, page_id: str, wait_for: str | None = None) -> Page:
+    """Navigate page_id's page (creating it if needed) and return it."""
+    browser = await get_browser()
+
+    if page_id not in _contexts:
+        if _idle_pages:
+            _contexts[page_id] = _idle_pages.popleft()
+        else:
+            context = await browser.new_context()
+            await context.add_init_script(script=HELPER_JS)
+            page = await context.new_page()
+            origins = _context_origins[context] = set()
+            page.on("framenavigated", lambda frame: _record_origin(origins, frame.url))
+            _contexts[page_id] = (context, page)
+
+    _, page = _contexts[page_id]
+
+    # Handle relative paths
+    if url:
+        if url.startswith("/"):
+            url = f"{settings.frontend_url}{url}"
+        elif not url.startswith("http"):
+            url = f"{settings.frontend_url}/{url}"
+    else:
+        url = settings.frontend_url
+
+    # networkidle waits out a 500ms quiet window that polling apps may
+    # never reach; wait for the DOM and, if given, the element that matters
+    await page.goto(url, wait_until="domcontentloaded")
+    if wait_for:
+        await page.wait_for_selector(wait_for)
+
+    return page
+
+
+async def _take_screenshot(
+    page: Page,
+    page_id: str,
+    full_page: bool = False,
+    selector: str | None = None,
+    filename: str | None = None,
+    format: Literal["jpeg", "png"] = "jpeg",
+    quality: int = 80,
+    max_bytes: int | None = None,
+    compress: bool = False,
+) -> dict:
+    """Screenshot page (or one element of it) to SCREENSHOT_DIR; see browser_screenshot."""
+    if not filename:
+        extension = "jpg" if format == "jpeg" else "png"
+        filename = f"screenshot_{page_id}_{time.time_ns()}_{next(_shot_counter)}.{extension}"
+
+    global _screenshot_dir_ready
+    if not _screenshot_dir_ready:
+        os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+        _screenshot_dir_ready = True
+    filepath = os.path.join(SCREENSHOT_DIR, filename)
+
+    options: dict = {"path": filepath, "type": format}
+    if format == "jpeg":
+        options["quality"] = quality
+
+    if selector:
+        target = await page.query_selector(selector)
+        if not target:
+            return {"error": f"Element not found: {selector}"}
+    else:
+        target = page
+        options["full_page"] = full_page
+
+    image = await target.screenshot(**options)
+    if format == "jpeg" and max_bytes:
+        while len(image) > max_bytes and options["quality"] > 35:
+            options["quality"] = max(35, options["quality"] - 5)
+            image = await target.screenshot(**options)
+
+    result = {"filepath": filepath, "filename": filename, "format": format}
+
+    if compress:
+        # The compressed image is the payload the caller asked for, so it all
+        # goes back; compress off the event loop
+        payload = await asyncio.to_thread(zlib.compress, image, 6)
+        encoded = base64.b64encode(payload).decode()
+        return {
+            **result,
+            "content_encoding": "deflate",
+            "base64": encoded,
+            "full_base64_length": len(encoded),
+        }
+
+    # Only a preview goes back, so encode just the 75 bytes behind its 100
+    # base64 chars instead of re-reading and encoding the whole file
+    return {
+        **result,
+        "content_encoding": "identity",
+        "base64_preview": base64.b64encode(image[:75]).decode() + "...",
+        "full_base64_length": (len(image) + 2) // 3 * 4,
+    }
+
+
+# How long browser_visual_test gives each asserted element to appear
+ASSERTION_WAIT_MS = 5000
+
+
+async def _wait_for_assertion_targets(page: Page, assertions: list["VisualAssertion"]) -> None:
+    """Wait, concurrently, for every asserted selector to be attached.
+
+    Stands in for the auto-wait that per-assertion locator calls used to give,
+    so a page that is still rendering doesn't fail the single evaluate. Missing
+    elements just time out here and are reported by the assertions themselves.
+    """
+    selectors = {
+        assertion.selector
+        for assertion in assertions
+        # Waiting can't help an assertion that expects no matches
+        if not (assertion.type == "element_count" and assertion.value == 0)
+    }
+    await asyncio.gather(
+        *(
+            page.wait_for_selector(selector, state="attached", timeout=ASSERTION_WAIT_MS)
+            for selector in selectors
+        ),
+        return_exceptions=True,
+    )
+
+
+class VisualAssertion(BaseModel):
+    """One check run by browser_visual_test."""
+
+    type: Literal["element_exists", "text_contains", "element_count"]
+    selector: str
+    value: str | int | None = None
+
+
+class RecordedAction(BaseModel):
+    """One step passed to browser_generate_test."""
+
+    action: str
+    params: dict[str, Any] = Field(default_factory=dict)
+
+
+# browser_generate_test line per action, with defaults for optional params;
+# !r quotes values as Python literals so embedded quotes can't break the code
+_TEST_TEMPLATES: dict[str, tuple[str, dict]] = {
+    "navigate": ("    page.goto({url!r})", {"url": "/"}),
+    "click": ("    page.click({selector!r})", {"selector": None}),
+    "fill": ("    page.fill({selector!r}, {value!r})", {"selector": None, "value": None}),
+    "screenshot": ("    page.screenshot(path={filename!r})", {"filename": "screenshot.png"}),
+    "assert_visible": (
+        "    expect(page.locator({selector!r})).to_be_visible()",
+        {"selector": None},
+    ),
+    "assert_text": (
+        "    expect(page.locator({selector!r})).to_contain_text({text!r})",
+        {"selector": None, "text": None},
+    ),
+}
+
+
+# Everything the next page_id could otherwise see of the origin the session used
+_RESET_STORAGE_JS = """
+async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    for (const {name} of await indexedDB.databases()) {
+        if (name) indexedDB.deleteDatabase(name);
+    }
+    // Cache Storage and service workers only exist on secure origins
+    if (window.caches) {
+        for (const key of await caches.keys()) {
+            await caches.delete(key);
+        }
+    }
+    if (navigator.serviceWorker) {
+        for (const registration of await navigator.serviceWorker.getRegistrations()) {
+            await registration.unregister();
+        }
+    }
+}
+"""
+
+
+async def _close_context(context: BrowserContext) -> None:
+    _context_origins.pop(context, None)
+    await context.close()
+
+
+async def _release_page(context: BrowserContext, page: Page) -> None:
+    """Reset a closed session and park it for reuse, or close it if that isn't safe."""
+    # Storage can only be cleared from a page on its own origin, so only a
+    # session that stayed on the page's current origin, in one tab, is reusable
+    origins = _context_origins.get(context, set())
+    if (
+        len(_idle_pages) >= IDLE_PAGE_LIMIT
+        or origins - {_origin(page.url)}
+        or len(context.pages) > 1
+    ):
+        await _close_context(context)
+        return
+
+    try:
+        await page.evaluate(_RESET_STORAGE_JS)
+        await page.goto("about:blank")
+        await context.clear_cookies()
+        await context.clear_permissions()
+    except Exception:
+        # A session that can't be reset cleanly isn't safe to hand out again
+        await _close_context(context)
+        return
+    origins.clear()
+    _idle_pages.append((context, page))
+
+
+# Chromium slows down for everyone when flooded, so cap concurrent tool calls
+_playwright_sem = asyncio.Semaphore(settings.playwright_concurrency)
+
+
+def _limited(tool):
+    """Run a tool under the concurrency limit."""
+
+    @functools.wraps(tool)
+    async def wrapper(*args, **kwargs):
+        async with _playwright_sem:
+            return await tool(*args, **kwargs)
+
+    return wrapper
+
+
+# Serializes exclusive holders so two of them can't each grab part of the permits
+_exclusive_lock = asyncio.Lock()
+
+
+@contextlib.asynccontextmanager
+async def _all_permits():
+    """Hold every concurrency slot, waiting for in-flight tool calls to finish."""
+    async with _exclusive_lock:
+        for _ in range(settings.playwright_concurrency):
+            await _playwright_sem.acquire()
+        try:
+            yield
+        finally:
+            for _ in range(settings.playwright_concurrency):
+                _playwright_sem.release()
+
+
 def register_playwright_tools(mcp: FastMCP) -> None:
     """Register all Playwright tools with the MCP server."""
 
     @mcp.tool
-    async def browser_navigate(url: str | None = None, page_id: str = "default") -> dict:
+    @_limited
+    async def browser_navigate(
+        url: str | None = None,
+        page_id: str = "default",
+        wait_for: str | None = None,
+    ) -> dict:
         """
         Navigate to a URL in the browser. Creates a new page if needed.
 
         Args:
             url: Full URL or path (e.g., "/dashboard"). If path, prepends frontend URL.
             page_id: Identifier for this page session (default: "default")
+            wait_for: CSS selector to wait for after the DOM has loaded
 
         Returns:
             Page information including title and current URL
         """
-        browser = await get_browser()
-
-        if page_id not in _pages:
-            _pages[page_id] = await browser.new_page()
-
-        page = _pages[page_id]
-
-        # Handle relative paths
-        if url:
-            if url.startswith("/"):
-                url = f"{settings.frontend_url}{url}"
-            elif not url.startswith("http"):
-                url = f"{settings.frontend_url}/{url}"
-        else:
-            url = settings.frontend_url
-
-        await page.goto(url, wait_until="networkidle")
+        page = await _open_page(url, page_id, wait_for)
 
         return {
             "page_id": page_id,
@@ -67,11 +408,16 @@ def register_playwright_tools(mcp: FastMCP) -> None:
         }
 
     @mcp.tool
+    @_limited
     async def browser_screenshot(
         page_id: str = "default",
         full_page: bool = False,
         selector: str | None = None,
         filename: str | None = None,
+        format: Literal["jpeg", "png"] = "jpeg",
+        quality: int = 80,
+        max_bytes: int | None = None,
+        compress: bool = False,
     ) -> dict:
         """
         Take a screenshot of the current page or a specific element.
@@ -81,67 +427,57 @@ def register_playwright_tools(mcp: FastMCP) -> None:
             full_page: Capture entire scrollable page
             selector: CSS selector to screenshot specific element
             filename: Custom filename (auto-generated if not provided)
+            format: Image format; use "png" when a lossless capture is needed
+            quality: JPEG quality (0-100)
+            max_bytes: For JPEG, lower the quality (down to 35) until the image fits
+            compress: Return the whole image zlib-compressed and base64-encoded
+                in "base64" (worthwhile for PNG; decode the base64, then
+                zlib.decompress) instead of just a preview
 
         Returns:
-            Screenshot path and base64-encoded image data
+            Screenshot path and a base64 preview, or the full compressed image
         """
-        if page_id not in _pages:
+        if page_id not in _contexts:
             return {"error": f"No page found with id '{page_id}'. Call browser_navigate first."}
 
-        page = _pages[page_id]
-
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"screenshot_{page_id}_{timestamp}.png"
-
-        os.makedirs(SCREENSHOT_DIR, exist_ok=True)
-        filepath = os.path.join(SCREENSHOT_DIR, filename)
-
-        if selector:
-            element = await page.query_selector(selector)
-            if element:
-                await element.screenshot(path=filepath)
-            else:
-                return {"error": f"Element not found: {selector}"}
-        else:
-            await page.screenshot(path=filepath, full_page=full_page)
-
-        # Read and encode
-        with open(filepath, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode()
-
-        return {
-            "filepath": filepath,
-            "filename": filename,
-            "base64_preview": image_data[:100] + "...",
-            "full_base64_length": len(image_data),
-        }
+        _, page = _contexts[page_id]
+        return await _take_screenshot(
+            page, page_id, full_page, selector, filename, format, quality, max_bytes, compress
+        )
 
     @mcp.tool
-    async def browser_click(selector: str, page_id: str = "default") -> dict:
+    @_limited
+    async def browser_click(
+        selector: str,
+        page_id: str = "default",
+        wait_for_navigation: bool = False,
+    ) -> dict:
         """
         Click an element on the page.
 
         Args:
             selector: CSS selector for the element
             page_id: Page session identifier
+            wait_for_navigation: Wait for the page the click loads to settle
 
         Returns:
             Success status and current URL after click
         """
-        if page_id not in _pages:
+        if page_id not in _contexts:
             return {"error": f"No page found with id '{page_id}'"}
 
-        page = _pages[page_id]
+        _, page = _contexts[page_id]
 
         try:
             await page.click(selector, timeout=5000)
-            await page.wait_for_load_state("networkidle")
+            if wait_for_navigation:
+                await page.wait_for_load_state("networkidle")
             return {"success": True, "selector": selector, "url": page.url}
         except Exception as e:
             return {"error": str(e), "selector": selector}
 
     @mcp.tool
+    @_limited
     async def browser_fill(selector: str, value: str, page_id: str = "default") -> dict:
         """
         Fill a form input with text.
@@ -154,10 +490,10 @@ def register_playwright_tools(mcp: FastMCP) -> None:
         Returns:
             Success status
         """
-        if page_id not in _pages:
+        if page_id not in _contexts:
             return {"error": f"No page found with id '{page_id}'"}
 
-        page = _pages[page_id]
+        _, page = _contexts[page_id]
 
         try:
             await page.fill(selector, value, timeout=5000)
@@ -166,6 +502,7 @@ def register_playwright_tools(mcp: FastMCP) -> None:
             return {"error": str(e)}
 
     @mcp.tool
+    @_limited
     async def browser_get_content(page_id: str = "default") -> dict:
         """
         Get the current page's text content and interactive elements.
@@ -176,54 +513,32 @@ def register_playwright_tools(mcp: FastMCP) -> None:
         Returns:
             Page title, URL, visible text, buttons, links, and inputs
         """
-        if page_id not in _pages:
+        if page_id not in _contexts:
             return {"error": f"No page found with id '{page_id}'"}
 
-        page = _pages[page_id]
-
-        # Extract visible text
-        text_content = await page.evaluate("() => document.body.innerText")
-
-        # Find interactive elements
-        buttons = await page.evaluate(
-            """
-            () => Array.from(document.querySelectorAll('button, [role="button"]'))
-                .map(el => ({text: el.innerText, class: el.className}))
-                .slice(0, 20)
-            """
-        )
-
-        links = await page.evaluate(
-            """
-            () => Array.from(document.querySelectorAll('a[href]'))
-                .map(el => ({text: el.innerText, href: el.href}))
-                .slice(0, 20)
-            """
-        )
+        _, page = _contexts[page_id]
 
-        inputs = await page.evaluate(
-            """
-            () => Array.from(document.querySelectorAll('input, textarea, select'))
-                .map(el => ({type: el.type, name: el.name, id: el.id, placeholder: el.placeholder}))
-                .slice(0, 20)
-            """
-        )
+        # Fetch the DOM once and parse it here instead of marshalling each
+        # element out of the page
+        content = _extract_content(await page.content(), page.url)
 
         return {
             "url": page.url,
-            "title": await page.title(),
-            "text_content": text_content[:5000],
-            "buttons": buttons,
-            "links": links,
-            "inputs": inputs,
+            "title": content["title"],
+            "text_content": content["text"],
+            "buttons": content["buttons"],
+            "links": content["links"],
+            "inputs": content["inputs"],
         }
 
     @mcp.tool
+    @_limited
     async def browser_visual_test(
         test_name: str,
         url: str,
-        assertions: list[dict],
+        assertions: list[VisualAssertion],
         page_id: str = "default",
+        wait_for: str | None = None,
     ) -> dict:
         """
         Run a visual test with assertions.
@@ -236,57 +551,31 @@ def register_playwright_tools(mcp: FastMCP) -> None:
                 - selector: CSS selector
                 - value: Expected value (for text_contains and element_count)
             page_id: Page session identifier
+            wait_for: CSS selector to wait for after the DOM has loaded, e.g. the
+                app's root element on a client-rendered page
 
         Returns:
             Test results with pass/fail for each assertion
         """
-        # Navigate to URL
-        await browser_navigate(url, page_id)
-        page = _pages[page_id]
-
-        results = []
-        all_passed = True
-
-        for assertion in assertions:
-            assertion_type = assertion.get("type")
-            selector = assertion.get("selector")
-            expected = assertion.get("value")
-
-            result = {"type": assertion_type, "selector": selector, "passed": False}
-
-            try:
-                if assertion_type == "element_exists":
-                    element = await page.query_selector(selector)
-                    result["passed"] = element is not None
-                    result["details"] = (
-                        "Element found" if element else "Element not found"
-                    )
-
-                elif assertion_type == "text_contains":
-                    text = await page.inner_text(selector)
-                    result["passed"] = expected in text
-                    result["details"] = (
-                        f"Found: '{text[:100]}...'"
-                        if len(text) > 100
-                        else f"Found: '{text}'"
-                    )
-
-                elif assertion_type == "element_count":
-                    elements = await page.query_selector_all(selector)
-                    actual_count = len(elements)
-                    result["passed"] = actual_count == expected
-                    result["details"] = f"Expected {expected}, found {actual_count}"
-
-            except Exception as e:
-                result["error"] = str(e)
-
-            if not result["passed"]:
-                all_passed = False
-            results.append(result)
+        # Navigate to URL; unlike browser_navigate, skip the title round trip
+        page = await _open_page(url, page_id, wait_for)
+
+        await _wait_for_assertion_targets(page, assertions)
+
+        # Every check runs in the page in one evaluate, not a round trip each
+        outcomes = await page.evaluate(
+            "a => window.__pocheMcp.runAssertions(a)",
+            [assertion.model_dump() for assertion in assertions],
+        )
+        results = [
+            {"type": assertion.type, "selector": assertion.selector, **outcome}
+            for assertion, outcome in zip(assertions, outcomes)
+        ]
+        all_passed = all(result["passed"] for result in results)
 
         # Take screenshot for reference
-        screenshot_result = await browser_screenshot(
-            page_id, filename=f"test_{test_name}.png"
+        screenshot_result = await _take_screenshot(
+            page, page_id, filename=f"test_{test_name}.jpg", quality=75
         )
 
         return {
@@ -299,7 +588,7 @@ def register_playwright_tools(mcp: FastMCP) -> None:
 
     @mcp.tool
     async def browser_generate_test(
-        actions: list[dict], test_name: str = "generated_test"
+        actions: list[RecordedAction], test_name: str = "generated_test"
     ) -> str:
         """
         Generate Playwright test code from a sequence of actions.
@@ -321,42 +610,15 @@ def register_playwright_tools(mcp: FastMCP) -> None:
         ]
 
         for action in actions:
-            action_type = action.get("action")
-            params = action.get("params", {})
-
-            if action_type == "navigate":
-                url = params.get("url", "/")
-                code_lines.append(f'    page.goto("{url}")')
-
-            elif action_type == "click":
-                selector = params.get("selector")
-                code_lines.append(f'    page.click("{selector}")')
-
-            elif action_type == "fill":
-                selector = params.get("selector")
-                value = params.get("value")
-                code_lines.append(f'    page.fill("{selector}", "{value}")')
-
-            elif action_type == "screenshot":
-                filename = params.get("filename", "screenshot.png")
-                code_lines.append(f'    page.screenshot(path="{filename}")')
-
-            elif action_type == "assert_visible":
-                selector = params.get("selector")
-                code_lines.append(
-                    f'    expect(page.locator("{selector}")).to_be_visible()'
-                )
-
-            elif action_type == "assert_text":
-                selector = params.get("selector")
-                text = params.get("text")
-                code_lines.append(
-                    f'    expect(page.locator("{selector}")).to_contain_text("{text}")'
-                )
+            entry = _TEST_TEMPLATES.get(action.action)
+            if entry is not None:
+                template, defaults = entry
+                code_lines.append(template.format_map({**defaults, **action.params}))
 
         return "\n".join(code_lines)
 
     @mcp.tool
+    @_limited
     async def browser_close_page(page_id: str = "default") -> dict:
         """
         Close a browser page session.
@@ -367,9 +629,8 @@ def register_playwright_tools(mcp: FastMCP) -> None:
         Returns:
             Success status
         """
-        if page_id in _pages:
-            await _pages[page_id].close()
-            del _pages[page_id]
+        if page_id in _contexts:
+            await _release_page(*_contexts.pop(page_id))
             return {"success": True, "page_id": page_id}
         return {"error": f"No page found with id '{page_id}'"}
 
@@ -377,18 +638,24 @@ def register_playwright_tools(mcp: FastMCP) -> None:
     async def browser_cleanup() -> dict:
         """
         Close all pages and browser. Call this when done with browser testing.
+        Waits for running browser tool calls to finish first.
 
         Returns:
             Success status
         """
-        global _browser, _pages
-
-        for page_id in list(_pages.keys()):
-            await _pages[page_id].close()
-        _pages.clear()
-
-        if _browser:
-            await _browser.close()
-            _browser = None
+        global _browser
+
+        # Take every slot so no running tool has its page closed under it
+        async with _all_permits():
+            # Closing a context closes its page too
+            for context, _ in (*_contexts.values(), *_idle_pages):
+                await context.close()
+            _contexts.clear()
+            _idle_pages.clear()
+            _context_origins.clear()
+
+            if _browser:
+                await _browser.close()
+                _browser = None
 
         return {"success": True, "message": "All browser resources cleaned up"}
@@ -1,5 +1,8 @@
 """PostgreSQL integration tools for the MCP server."""
 
+import asyncio
+import re
+
 import asyncpg
 from fastmcp import FastMCP
 
@@ -7,12 +10,29 @@ from ..config import settings
 
 _pool: asyncpg.Pool | None = None
 
+# Rows returned by db_execute_query
+QUERY_ROW_LIMIT = 100
+
+# Leading keyword of a read query, skipping whitespace and SQL comments; only
+# the prefix is scanned, so long queries aren't copied or uppercased
+_SELECT_RE = re.compile(
+    r"\s*(?:/\*.*?\*/\s*|--[^\n]*\n\s*)*(?:SELECT|WITH)\b", re.IGNORECASE | re.DOTALL
+)
+
 
 async def get_pool() -> asyncpg.Pool:
     """Get or create database connection pool."""
     global _pool
     if _pool is None:
-        _pool = await asyncpg.create_pool(settings.database_url)
+        # The introspection tools repeat the same handful of catalog queries;
+        # keep their prepared statements per connection for the pool's lifetime.
+        # asyncpg's default 10 warm connections cover db_describe_table's four
+        # parallel lookups.
+        _pool = await asyncpg.create_pool(
+            settings.database_url,
+            statement_cache_size=256,
+            max_cached_statement_lifetime=0,
+        )
     return _pool
 
 
@@ -58,9 +78,16 @@ def register_postgres_tools(mcp: FastMCP) -> None:
             Table details including columns, primary key, foreign keys, and indexes
         """
         pool = await get_pool()
-        async with pool.acquire() as conn:
-            # Get columns
-            columns = await conn.fetch(
+
+        # The four lookups are independent, so run them on separate pool
+        # connections at once rather than one after another on a single one
+        async def fetch(query: str) -> list[asyncpg.Record]:
+            async with pool.acquire() as conn:
+                return await conn.fetch(query, schema, table_name)
+
+        columns, pk, fks, indexes = await asyncio.gather(
+            # Columns
+            fetch(
                 """
                 SELECT
                     column_name,
@@ -72,24 +99,18 @@ def register_postgres_tools(mcp: FastMCP) -> None:
                 WHERE table_schema = $1 AND table_name = $2
                 ORDER BY ordinal_position
                 """,
-                schema,
-                table_name,
-            )
-
-            # Get primary key
-            pk = await conn.fetch(
+            ),
+            # Primary key
+            fetch(
                 """
                 SELECT a.attname
                 FROM pg_index i
                 JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
                 WHERE i.indrelid = ($1 || '.' || $2)::regclass AND i.indisprimary
                 """,
-                schema,
-                table_name,
-            )
-
-            # Get foreign keys
-            fks = await conn.fetch(
+            ),
+            # Foreign keys
+            fetch(
                 """
                 SELECT
                     kcu.column_name,
@@ -103,29 +124,25 @@ def register_postgres_tools(mcp: FastMCP) -> None:
                 WHERE tc.constraint_type = 'FOREIGN KEY'
                     AND tc.table_schema = $1 AND tc.table_name = $2
                 """,
-                schema,
-                table_name,
-            )
-
-            # Get indexes
-            indexes = await conn.fetch(
+            ),
+            # Indexes
+            fetch(
                 """
                 SELECT indexname, indexdef
                 FROM pg_indexes
                 WHERE schemaname = $1 AND tablename = $2
                 """,
-                schema,
-                table_name,
-            )
-
-            return {
-                "table_name": table_name,
-                "schema": schema,
-                "columns": [dict(c) for c in columns],
-                "primary_key": [r["attname"] for r in pk],
-                "foreign_keys": [dict(fk) for fk in fks],
-                "indexes": [dict(i) for i in indexes],
-            }
+            ),
+        )
+
+        return {
+            "table_name": table_name,
+            "schema": schema,
+            "columns": [dict(c) for c in columns],
+            "primary_key": [r["attname"] for r in pk],
+            "foreign_keys": [dict(fk) for fk in fks],
+            "indexes": [dict(i) for i in indexes],
+        }
 
     @mcp.tool
     async def db_execute_query(query: str, params: list | None = None) -> dict:
@@ -140,23 +157,25 @@ def register_postgres_tools(mcp: FastMCP) -> None:
             Query results as list of dictionaries
         """
         # Safety check - only allow SELECT
-        query_upper = query.strip().upper()
-        if not query_upper.startswith("SELECT") and not query_upper.startswith("WITH"):
+        if not _SELECT_RE.match(query):
             return {"error": "Only SELECT queries are allowed for safety"}
 
         pool = await get_pool()
         async with pool.acquire() as conn:
             try:
-                if params:
-                    rows = await conn.fetch(query, *params)
-                else:
-                    rows = await conn.fetch(query)
-
+                # Stream through a server-side cursor (which needs a
+                # transaction) and stop one row past the limit, so large
+                # results are never fully materialized
+                async with conn.transaction(readonly=True):
+                    cursor = await conn.cursor(query, *(params or ()))
+                    rows = await cursor.fetch(QUERY_ROW_LIMIT + 1)
+
+                # row_count is capped at QUERY_ROW_LIMIT + 1 for truncated results
                 return {
                     "success": True,
                     "row_count": len(rows),
-                    "data": [dict(row) for row in rows[:100]],
-                    "truncated": len(rows) > 100,
+                    "data": [dict(row) for row in rows[:QUERY_ROW_LIMIT]],
+                    "truncated": len(rows) > QUERY_ROW_LIMIT,
                 }
             except Exception as e:
                 return {"error": str(e)}
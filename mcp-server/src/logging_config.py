@@ -2,13 +2,20 @@
 
 import logging
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
 
 from .config import settings
 
+# Background thread that owns the file handlers
+_listener: QueueListener | None = None
+
 
 def setup_logging() -> None:
     """Configure logging for the MCP server."""
+    global _listener
+
     log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
 
     # Create logs directory if it doesn't exist
@@ -40,12 +47,18 @@ def setup_logging() -> None:
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(file_formatter)
 
+    # File writes happen on the listener thread, not in tool coroutines
+    log_queue: SimpleQueue = SimpleQueue()
+    _listener = QueueListener(
+        log_queue, file_handler, error_handler, respect_handler_level=True
+    )
+    _listener.start()
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(error_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
 
     # Reduce noise from third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -53,3 +66,12 @@ def setup_logging() -> None:
     logging.getLogger("playwright").setLevel(logging.WARNING)
 
     logging.info(f"MCP Server logging configured with level: {settings.log_level}")
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the file logging thread."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
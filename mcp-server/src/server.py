@@ -1,11 +1,14 @@
 """Main MCP server entry point with all integrations."""
 
 import logging
+from typing import Any
 
+import orjson
 from fastmcp import FastMCP
+from pydantic_core import to_jsonable_python
 
 from .config import settings
-from .logging_config import setup_logging
+from .logging_config import setup_logging, shutdown_logging
 from .integrations import (
     register_postgres_tools,
     register_fastapi_tools,
@@ -16,10 +19,18 @@ from .integrations import (
 setup_logging()
 logger = logging.getLogger(__name__)
 
+
+def serialize_tool_result(data: Any) -> str:
+    """Serialize a tool's return value for the MCP response."""
+    # pydantic covers the types orjson doesn't, e.g. Decimal in database rows
+    return orjson.dumps(data, default=to_jsonable_python).decode()
+
+
 # Create the unified MCP server
 mcp = FastMCP(
     name="App Dev MCP Server",
-    description="Unified MCP server with PostgreSQL, FastAPI, and Playwright integrations for AI-assisted development",
+    instructions="Unified MCP server with PostgreSQL, FastAPI, and Playwright integrations for AI-assisted development",
+    tool_serializer=serialize_tool_result,
 )
 
 # Register all integration tools
@@ -31,7 +42,10 @@ register_playwright_tools(mcp)
 def main():
     """Run the MCP server."""
     logger.info(f"Starting MCP server on port {settings.mcp_port}")
-    mcp.run(transport="sse", port=settings.mcp_port)
+    try:
+        mcp.run(transport="sse", port=settings.mcp_port)
+    finally:
+        shutdown_logging()
 
 
 if __name__ == "__main__":
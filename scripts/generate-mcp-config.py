@@ -3,7 +3,9 @@
 
 import json
 import os
+import stat
 import sys
+import tempfile
 
 
 def generate_claude_config(mcp_url: str = "http://localhost:8080") -> dict:
@@ -18,6 +20,31 @@ def generate_claude_config(mcp_url: str = "http://localhost:8080") -> dict:
     }
 
 
+def write_config(config: dict, path: str) -> None:
+    """Write config as JSON, replacing any existing file atomically."""
+    # A temp file in the same directory can be renamed over the target, so an
+    # interrupted write never leaves a truncated config behind
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(config, f, indent=2)
+        # mkstemp creates the file as 0600; keep an existing config's mode, or
+        # give a new one the umask default a plain open() would
+        if os.path.exists(path):
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
 def get_default_config_path() -> str:
     """Get the default config path based on OS."""
     if sys.platform == "win32":
@@ -64,13 +91,11 @@ def main():
             existing.setdefault("mcpServers", {}).update(config["mcpServers"])
             config = existing
 
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        write_config(config, config_path)
         print(f"Configuration installed to: {config_path}")
 
     elif args.output:
-        with open(args.output, "w") as f:
-            json.dump(config, f, indent=2)
+        write_config(config, args.output)
         print(f"Configuration written to: {args.output}")
 
     else:
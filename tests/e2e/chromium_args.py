@@ -0,0 +1,14 @@
+"""Chromium flags shared by the e2e suite and the manual scripts."""
+
+# The editor only needs the renderer and WebGL; skip everything else Chromium starts
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-features=TranslateUI,BackForwardCache",
+    "--disable-renderer-backgrounding",
+    "--blink-settings=imagesEnabled=false",
+    "--no-first-run",
+    "--mute-audio",
+]
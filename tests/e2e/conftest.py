@@ -1,7 +1,11 @@
 """Pytest configuration for e2e tests."""
 
+import re
+
 import pytest
 
+from chromium_args import CHROMIUM_ARGS
+
 
 @pytest.fixture(scope="session")
 def browser_context_args(browser_context_args):
@@ -14,8 +18,46 @@ def browser_context_args(browser_context_args):
 
 @pytest.fixture(scope="session")
 def browser_type_launch_args(browser_type_launch_args):
-    """Configure browser launch with headless mode."""
+    """Configure browser launch with headless mode and trimmed Chromium flags."""
     return {
         **browser_type_launch_args,
         "headless": True,
+        "args": CHROMIUM_ARGS,
     }
+
+
+@pytest.fixture(scope="class")
+def context(browser, browser_context_args):
+    """Share one browser context across the tests of a class."""
+    context = browser.new_context(**browser_context_args)
+    yield context
+    context.close()
+
+
+@pytest.fixture(scope="class")
+def page(context):
+    """Keep one loaded page per class; tests reset the editor in place."""
+    page = context.new_page()
+    yield page
+    page.close()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Screenshot the page and attach browser console output when a test fails."""
+    outcome = yield
+    report = outcome.get_result()
+    if report.when != "call" or not report.failed:
+        return
+
+    page = item.funcargs.get("page")
+    if page is not None:
+        name = re.sub(r"\W+", "_", item.nodeid)
+        page.screenshot(path=f"/results/FAIL_{name}.jpg", type="jpeg", quality=60)
+
+    messages = getattr(item.instance, "console_messages", None)
+    if messages:
+        report.sections.append((
+            "browser console",
+            "\n".join(f"[{msg_type}] {text}" for msg_type, text in messages),
+        ))
@@ -25,7 +25,7 @@ def main():
         print("Screenshot 1: Initial state saved")
 
         # Check initial state from status bar
-        status = page.locator('text=/\\d+ vertices, \\d+ edges/').first
+        status = page.get_by_test_id('vertex-count')
         if status.is_visible():
             print(f"Initial status: {status.text_content()}")
 
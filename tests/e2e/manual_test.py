@@ -2,117 +2,235 @@
 """
 Manual test script for the CAD editor.
 Tests the new hold-to-activate tools and keyboard shortcuts.
+
+Each check opens its own page. The checks are named check_* so the e2e
+container's pytest run does not collect them. Run directly with --repl to keep
+one browser warm between runs.
 """
 
+import argparse
+import os
+import sys
+
 from playwright.sync_api import sync_playwright
-import time
 
-def test_cad_editor():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+from chromium_args import CHROMIUM_ARGS
+
+EDITOR_URL = os.environ.get('EDITOR_URL', 'http://localhost:5173')
+RESULTS_DIR = os.environ.get(
+    'RESULTS_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'results')
+)
+
+
+def open_editor(page):
+    """Load the editor and return the canvas center."""
+    print("Navigating to editor...")
+    page.goto(EDITOR_URL, wait_until='domcontentloaded')
+
+    # Wait for the canvas to draw its first frame
+    page.wait_for_function('() => window.__poche?.rendererReady === true', timeout=10000)
+
+    # Get canvas bounds
+    canvas = page.query_selector('canvas')
+    box = canvas.bounding_box()
+    center_x = box['x'] + box['width'] / 2
+    center_y = box['y'] + box['height'] / 2
+    return center_x, center_y
+
+
+# Hold a tool key, click each point, release: all in one evaluate with no sleeps.
+# Toolbar listens for keys on window and Scene reads the tool through a synchronous
+# store subscription, so events dispatched in order on the canvas are enough.
+HOLD_AND_CLICK_JS = """([key, points]) => {
+    const canvas = document.querySelector('canvas');
+    canvas.dispatchEvent(new KeyboardEvent('keydown', { key, bubbles: true }));
+    for (const [x, y] of points) {
+        const init = { clientX: x, clientY: y, button: 0, bubbles: true };
+        const pointer = { ...init, pointerId: 1, isPrimary: true };
+        canvas.dispatchEvent(new PointerEvent('pointermove', pointer));
+        canvas.dispatchEvent(new PointerEvent('pointerdown', { ...pointer, buttons: 1 }));
+        canvas.dispatchEvent(new PointerEvent('pointerup', pointer));
+        canvas.dispatchEvent(new MouseEvent('click', init));
+    }
+    canvas.dispatchEvent(new KeyboardEvent('keyup', { key, bubbles: true }));
+}"""
+
+
+def hold_and_click(page, key, points):
+    """Hold a tool key, click each point, then release the key."""
+    page.evaluate(HOLD_AND_CLICK_JS, [key, points])
+
+
+def draw_line(page, center_x, center_y):
+    """Hold A and place two points; releasing A returns to select."""
+    hold_and_click(page, 'a', [(center_x - 100, center_y), (center_x + 100, center_y)])
+
+
+# CDP Input.dispatchKeyEvent modifier bits
+META = 4
+SHIFT = 8
+
+
+def shortcut(cdp, key, modifiers):
+    """Send a modified key press as one key-down/key-up pair over CDP."""
+    params = {
+        'modifiers': modifiers,
+        'key': key,
+        'code': f'Key{key.upper()}',
+        'windowsVirtualKeyCode': ord(key.upper()),
+    }
+    cdp.send('Input.dispatchKeyEvent', {'type': 'rawKeyDown', **params})
+    cdp.send('Input.dispatchKeyEvent', {'type': 'keyUp', **params})
+
 
-        print("Navigating to editor...")
-        page.goto('http://localhost:5173')
-        page.wait_for_load_state('networkidle')
+def vertex_count(page):
+    return page.evaluate('() => window.__poche().vertexCount')
 
-        # Wait for canvas to be ready
-        page.wait_for_selector('canvas', timeout=10000)
-        time.sleep(1)  # Give WebGL time to initialize
 
-        # Get canvas bounds
-        canvas = page.query_selector('canvas')
-        box = canvas.bounding_box()
-        center_x = box['x'] + box['width'] / 2
-        center_y = box['y'] + box['height'] / 2
+def wait_for_vertex_change(page, before):
+    page.wait_for_function('(before) => window.__poche().vertexCount !== before', arg=before)
 
-        print("Testing hold-to-activate line tool (A key)...")
-        # Hold A key to activate line tool
-        page.keyboard.down('a')
-        time.sleep(0.2)
 
-        # Click to place first point
-        page.mouse.click(center_x - 100, center_y)
-        time.sleep(0.2)
+def check_line_tool(page):
+    center_x, center_y = open_editor(page)
 
-        # Click to place second point
-        page.mouse.click(center_x + 100, center_y)
-        time.sleep(0.2)
+    print("Testing hold-to-activate line tool (A key)...")
+    draw_line(page, center_x, center_y)
 
-        # Release A key - should return to select
-        page.keyboard.up('a')
-        time.sleep(0.2)
+    # Check geometry count
+    stats = page.get_by_test_id('vertex-count').inner_text()
+    print(f"After line: {stats}")
 
-        # Check geometry count
-        stats = page.locator('text=/\\d+ vertices/').inner_text()
-        vertices_match = stats.split()[0]
-        print(f"After line: {stats}")
 
-        print("Testing rectangle tool (S key)...")
-        # Hold S key to activate rectangle tool
-        page.keyboard.down('s')
-        time.sleep(0.2)
+def check_rectangle_undo_redo(page):
+    center_x, center_y = open_editor(page)
 
-        # Click first corner
-        page.mouse.click(center_x - 50, center_y + 50)
-        time.sleep(0.3)
+    print("Testing rectangle tool (S key)...")
+    # Hold S, click first corner then opposite corner
+    hold_and_click(page, 's', [(center_x - 50, center_y + 50), (center_x + 50, center_y + 100)])
 
-        # Click opposite corner
-        page.mouse.click(center_x + 50, center_y + 100)
-        time.sleep(0.2)
+    stats = page.get_by_test_id('vertex-count').inner_text()
+    print(f"After rectangle: {stats}")
 
-        # Release S key
-        page.keyboard.up('s')
-        time.sleep(0.2)
+    cdp = page.context.new_cdp_session(page)
 
-        stats = page.locator('text=/\\d+ vertices/').inner_text()
-        print(f"After rectangle: {stats}")
+    print("Testing undo (Cmd+Z)...")
+    before = vertex_count(page)
+    shortcut(cdp, 'z', META)
+    wait_for_vertex_change(page, before)
 
-        print("Testing undo (Cmd+Z)...")
-        page.keyboard.press('Meta+z')
-        time.sleep(0.2)
+    stats = page.get_by_test_id('vertex-count').inner_text()
+    print(f"After undo: {stats}")
 
-        stats = page.locator('text=/\\d+ vertices/').inner_text()
-        print(f"After undo: {stats}")
+    print("Testing redo (Cmd+X)...")
+    before = vertex_count(page)
+    shortcut(cdp, 'x', META)
+    wait_for_vertex_change(page, before)
 
-        print("Testing redo (Cmd+X)...")
-        page.keyboard.press('Meta+x')
-        time.sleep(0.2)
+    stats = page.get_by_test_id('vertex-count').inner_text()
+    print(f"After redo: {stats}")
 
-        stats = page.locator('text=/\\d+ vertices/').inner_text()
-        print(f"After redo: {stats}")
 
-        print("Testing clear scene (Shift+C)...")
-        page.keyboard.press('Shift+c')
-        time.sleep(0.2)
+def check_clear_scene(page):
+    center_x, center_y = open_editor(page)
+    draw_line(page, center_x, center_y)
 
-        stats = page.locator('text=/\\d+ vertices/').inner_text()
-        print(f"After clear: {stats}")
+    cdp = page.context.new_cdp_session(page)
 
-        print("Testing circle tool (D key)...")
-        page.keyboard.down('d')
-        time.sleep(0.2)
+    print("Testing clear scene (Shift+C)...")
+    shortcut(cdp, 'C', SHIFT)
+    page.wait_for_function('() => window.__poche().vertexCount === 0')
 
-        # Click center
-        page.mouse.click(center_x, center_y)
-        time.sleep(0.3)
+    stats = page.get_by_test_id('vertex-count').inner_text()
+    print(f"After clear: {stats}")
 
-        # Click to set radius
-        page.mouse.click(center_x + 80, center_y)
-        time.sleep(0.2)
 
-        page.keyboard.up('d')
-        time.sleep(0.2)
+def check_circle_tool(page):
+    center_x, center_y = open_editor(page)
 
-        stats = page.locator('text=/\\d+ vertices/').inner_text()
-        print(f"After circle: {stats}")
+    print("Testing circle tool (D key)...")
+    # Hold D, click center then click to set radius
+    hold_and_click(page, 'd', [(center_x, center_y), (center_x + 80, center_y)])
 
-        # Take final screenshot
-        page.screenshot(path='/Users/worthy/TestCode/FunCode/poche/tests/results/final_test.png')
-        print("Screenshot saved to tests/results/final_test.png")
+    stats = page.get_by_test_id('vertex-count').inner_text()
+    print(f"After circle: {stats}")
+
+    # Take final screenshot
+    path = os.path.join(RESULTS_DIR, 'final_test.jpg')
+    page.screenshot(path=path, type='jpeg', quality=60)
+    print(f"Screenshot saved to {path}")
+
+
+CHECKS = [check_line_tool, check_rectangle_undo_redo, check_clear_scene, check_circle_tool]
+
+
+# Started on first use and kept for the life of the process
+_playwright = None
+_browser = None
+
+
+def get_browser(cdp_url=None):
+    """Start Playwright and Chromium once, or attach to a running Chromium over CDP."""
+    global _playwright, _browser
+    if _browser is None:
+        _playwright = sync_playwright().start()
+        if cdp_url:
+            _browser = _playwright.chromium.connect_over_cdp(cdp_url)
+        else:
+            _browser = _playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+    return _browser
+
+
+def close_browser():
+    global _playwright, _browser
+    if _browser is not None:
+        _browser.close()
+        _browser = None
+    if _playwright is not None:
+        _playwright.stop()
+        _playwright = None
+
+
+def run_check(check, cdp_url=None):
+    page = get_browser(cdp_url).new_page()
+    try:
+        check(page)
+    finally:
+        page.close()
+
+
+def main():
+    checks = {check.__name__.removeprefix('check_'): check for check in CHECKS}
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('checks', nargs='*', metavar='CHECK',
+                        help=f"checks to run: {', '.join(checks)} (default: all)")
+    parser.add_argument('--repl', action='store_true',
+                        help='keep the browser warm and read check names from stdin')
+    parser.add_argument('--attach', metavar='CDP_URL',
+                        help='reuse a Chromium started with --remote-debugging-port, e.g. http://localhost:9222')
+    args = parser.parse_args()
+    unknown = [name for name in args.checks if name not in checks]
+    if unknown:
+        parser.error(f"unknown check: {', '.join(unknown)}")
+
+    try:
+        for name in args.checks or ([] if args.repl else checks):
+            run_check(checks[name], args.attach)
+
+        if args.repl:
+            print(f"Checks: {', '.join(checks)}. Ctrl-D to quit.")
+            for line in sys.stdin:
+                name = line.strip()
+                if name in checks:
+                    run_check(checks[name], args.attach)
+                elif name:
+                    print(f"Unknown check: {name}")
 
         print("\n✓ All tests completed!")
-        browser.close()
+    finally:
+        close_browser()
+
 
 if __name__ == '__main__':
-    test_cad_editor()
+    main()
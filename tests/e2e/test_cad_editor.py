@@ -1,32 +1,103 @@
 """End-to-end tests for the 3D CAD editor."""
 
+import os
+
 import pytest
 from playwright.sync_api import Page, expect
-import time
+
+EDITOR_URL = "http://frontend:5173"
+
+# Failures are captured by conftest; set SCREENSHOT_ALL=1 to also keep passing runs
+SCREENSHOT_ALL = os.environ.get("SCREENSHOT_ALL") == "1"
+
+
+# Installed before the editor loads; clicks each point in one synchronous JS pass.
+# R3F only fires onClick for objects hit on pointerdown, and the tools read their
+# snapped preview from pointermove, so each point gets the full event sequence.
+DRAW_POLYLINE_JS = """
+window.__pocheDrawPolyline = (points) => {
+    const canvas = document.querySelector('canvas');
+    for (const [x, y] of points) {
+        const init = { clientX: x, clientY: y, button: 0, bubbles: true };
+        const pointer = { ...init, pointerId: 1, isPrimary: true };
+        canvas.dispatchEvent(new PointerEvent('pointermove', pointer));
+        canvas.dispatchEvent(new PointerEvent('pointerdown', { ...pointer, buttons: 1 }));
+        canvas.dispatchEvent(new PointerEvent('pointerup', pointer));
+        canvas.dispatchEvent(new MouseEvent('click', init));
+    }
+};
+"""
+
+# Resolves after the editor's next animation frame. The frame loop itself is left
+# alone: R3F reschedules it every frame, so a microtask requestAnimationFrame stub
+# would never yield back to the page.
+NEXT_FRAME_JS = "() => new Promise((resolve) => requestAnimationFrame(() => resolve()))"
+
+
+def _scene_counts(page: Page) -> dict[str, int]:
+    """Read vertex, edge and face counts in a single evaluate."""
+    return page.evaluate(
+        """() => {
+            const scene = window.__poche();
+            return { vertices: scene.vertexCount, edges: scene.edgeCount, faces: scene.faceCount };
+        }"""
+    )
+
+
+def _draw_polyline(page: Page, points: list[tuple[float, float]]):
+    """Click through the points with the active tool in a single evaluate."""
+    page.evaluate("(points) => window.__pocheDrawPolyline(points)", points)
 
 
 class TestCADEditor:
     """Test suite for CAD editor functionality."""
 
-    console_messages = []
-
     @pytest.fixture(autouse=True)
     def setup(self, page: Page):
-        """Navigate to the editor before each test."""
-        # Clear console messages for each test
-        TestCADEditor.console_messages = []
+        """Load or reset the editor before each test."""
+        # Per-instance so parallel workers never share messages
+        self.console_messages = []
 
-        # Capture console messages
+        # Capture console messages; conftest only formats them if the test fails
         def handle_console(msg):
-            TestCADEditor.console_messages.append(f"[{msg.type}] {msg.text}")
-            print(f"CONSOLE: [{msg.type}] {msg.text}")
+            self.console_messages.append((msg.type, msg.text))
 
         page.on("console", handle_console)
 
-        page.goto("http://frontend:5173")
-        page.wait_for_load_state("networkidle")
-        # Wait for 3D canvas to initialize
-        time.sleep(2)
+        # Load the editor once per page, then just reset it between tests
+        if page.url.startswith(EDITOR_URL):
+            page.evaluate("() => window.__poche.reset()")
+        else:
+            page.add_init_script(DRAW_POLYLINE_JS)
+            page.goto(EDITOR_URL, wait_until="domcontentloaded")
+        # Set by the editor once the canvas has drawn its first frame
+        page.wait_for_function("() => window.__poche?.rendererReady === true", timeout=5000)
+
+        # Measure the canvas once here instead of in every test
+        box = page.locator("canvas").first.bounding_box()
+        assert box is not None, "Canvas should have a bounding box"
+        self.canvas_box = box
+        self.canvas_center = (box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
+
+        # Status bar counts, looked up by test id instead of a regex text scan
+        self.vertices_status = page.get_by_test_id("vertex-count")
+        self.faces_status = page.get_by_test_id("face-count")
+
+        yield
+
+        page.remove_listener("console", handle_console)
+
+    def final_screenshot(self, page: Page, name: str, clip_to_canvas: bool = True):
+        """Save the end state of a test when SCREENSHOT_ALL is set."""
+        if SCREENSHOT_ALL:
+            # Let the render loop draw the latest store state before capturing
+            page.evaluate(NEXT_FRAME_JS)
+            page.screenshot(
+                path=f"/results/{name}.jpg",
+                type="jpeg",
+                quality=60,
+                clip=self.canvas_box if clip_to_canvas else None,
+            )
 
     def test_editor_loads(self, page: Page):
         """Test that the editor page loads correctly."""
@@ -37,8 +108,7 @@ class TestCADEditor:
         canvas = page.locator("canvas")
         expect(canvas).to_be_visible()
 
-        # Take screenshot
-        page.screenshot(path="/results/01_editor_loaded.png")
+        self.final_screenshot(page, "01_editor_loaded", clip_to_canvas=False)
 
     def test_toolbar_visible(self, page: Page):
         """Test that the toolbar is visible with tools."""
@@ -46,101 +116,65 @@ class TestCADEditor:
         buttons = page.locator("button").all()
         assert len(buttons) > 5, "Toolbar should have multiple tool buttons"
 
-        page.screenshot(path="/results/02_toolbar_visible.png")
+        self.final_screenshot(page, "02_toolbar_visible", clip_to_canvas=False)
 
     def test_line_tool_activation(self, page: Page):
         """Test that pressing L activates the line tool."""
         # Press L to activate line tool
         page.keyboard.press("l")
-        time.sleep(0.5)
 
         # The line button should be highlighted (has bg-blue-600 class)
         # We can verify by checking if orbit controls are disabled
-        page.screenshot(path="/results/03_line_tool_activated.png")
+        self.final_screenshot(page, "03_line_tool_activated")
 
     def test_draw_line(self, page: Page):
         """Test drawing a line on the canvas."""
-        # Get canvas bounds
-        canvas = page.locator("canvas").first
-        box = canvas.bounding_box()
-        assert box is not None, "Canvas should have a bounding box"
+        center_x, center_y = self.canvas_center
 
-        center_x = box["x"] + box["width"] / 2
-        center_y = box["y"] + box["height"] / 2
-
-        print(f"Canvas bounds: {box}")
+        print(f"Canvas bounds: {self.canvas_box}")
         print(f"Center point: ({center_x}, {center_y})")
 
         # Check initial status
         status_bar = page.locator("[class*='StatusBar'], footer, .absolute.bottom-0").first
         print(f"Initial status bar content: {status_bar.text_content() if status_bar.is_visible() else 'not visible'}")
 
-        # Screenshot before line tool
-        page.screenshot(path="/results/04a_before_line_tool.png")
-
         # Activate line tool
         print("Pressing 'l' to activate line tool...")
         page.keyboard.press("l")
-        time.sleep(0.5)
-
-        # Screenshot after activating tool
-        page.screenshot(path="/results/04b_line_tool_active.png")
 
         # Click first point
         x1, y1 = center_x - 100, center_y
         print(f"Clicking first point at ({x1}, {y1})...")
         page.mouse.click(x1, y1)
-        time.sleep(0.5)
 
-        # Screenshot after first click
-        page.screenshot(path="/results/04c_after_first_click.png")
         print(f"Status after first click: {status_bar.text_content() if status_bar.is_visible() else 'not visible'}")
 
         # Move and click second point
         x2, y2 = center_x + 100, center_y
         print(f"Moving to ({x2}, {y2})...")
         page.mouse.move(x2, y2)
-        time.sleep(0.3)
 
         print(f"Clicking second point at ({x2}, {y2})...")
         page.mouse.click(x2, y2)
-        time.sleep(0.5)
 
-        # Screenshot after second click
-        page.screenshot(path="/results/04d_after_second_click.png")
         print(f"Status after second click: {status_bar.text_content() if status_bar.is_visible() else 'not visible'}")
 
         # Finish drawing
         print("Pressing Escape to finish drawing...")
         page.keyboard.press("Escape")
-        time.sleep(0.3)
-
-        # Take final screenshot
-        page.screenshot(path="/results/04_line_drawn.png")
 
-        # Print all console messages
-        print("\n--- CONSOLE MESSAGES ---")
-        for msg in TestCADEditor.console_messages:
-            print(msg)
-        print("--- END CONSOLE MESSAGES ---\n")
+        self.final_screenshot(page, "04_line_drawn")
 
         # Check status bar shows vertices/edges
-        final_status = page.locator("text=/\\d+ vertices/")
-        print(f"Final status text: {final_status.text_content() if final_status.is_visible() else 'not visible'}")
-        expect(final_status).to_be_visible()
+        print(f"Final status text: {self.vertices_status.text_content() if self.vertices_status.is_visible() else 'not visible'}")
+        expect(self.vertices_status).to_be_visible()
 
     def test_draw_triangle(self, page: Page):
         """Test drawing a closed triangle - should create a face."""
-        canvas = page.locator("canvas").first
-        box = canvas.bounding_box()
-        assert box is not None
-
-        center_x = box["x"] + box["width"] / 2
-        center_y = box["y"] + box["height"] / 2
+        center_x, center_y = self.canvas_center
 
         # Activate line tool
         page.keyboard.press("l")
-        time.sleep(0.3)
 
         # Draw triangle - need to close it to create a face
         points = [
@@ -150,37 +184,22 @@ class TestCADEditor:
             (center_x, center_y - 80),      # Back to top (close the loop)
         ]
 
-        for i, (x, y) in enumerate(points):
-            if i == 0:
-                page.mouse.click(x, y)
-            else:
-                page.mouse.move(x, y)
-                time.sleep(0.1)
-                page.mouse.click(x, y)
-            time.sleep(0.2)
+        _draw_polyline(page, points)
 
         page.keyboard.press("Escape")
-        time.sleep(0.3)
 
-        page.screenshot(path="/results/05_triangle_drawn.png")
+        self.final_screenshot(page, "05_triangle_drawn")
 
         # Check that a face was created
-        faces_status = page.locator("text=/\\d+ faces/")
-        expect(faces_status).to_be_visible()
-        print(f"Faces status: {faces_status.text_content()}")
+        expect(self.faces_status).to_contain_text("1 face")
+        print(f"Faces status: {self.faces_status.text_content()}")
 
     def test_draw_rectangle_with_diagonal(self, page: Page):
         """Test that drawing a diagonal through a rectangle creates 2 faces."""
-        canvas = page.locator("canvas").first
-        box = canvas.bounding_box()
-        assert box is not None
-
-        center_x = box["x"] + box["width"] / 2
-        center_y = box["y"] + box["height"] / 2
+        center_x, center_y = self.canvas_center
 
         # Activate line tool
         page.keyboard.press("l")
-        time.sleep(0.3)
 
         # Draw a rectangle (4 points, closing back to start)
         rect_points = [
@@ -191,73 +210,47 @@ class TestCADEditor:
             (center_x - 60, center_y - 40),  # Back to top-left (close)
         ]
 
-        for i, (x, y) in enumerate(rect_points):
-            if i == 0:
-                page.mouse.click(x, y)
-            else:
-                page.mouse.move(x, y)
-                time.sleep(0.1)
-                page.mouse.click(x, y)
-            time.sleep(0.2)
+        _draw_polyline(page, rect_points)
 
         page.keyboard.press("Escape")
-        time.sleep(0.3)
 
         # Should have 1 face (the rectangle)
-        page.screenshot(path="/results/10_rectangle_1_face.png")
+        expect(self.faces_status).to_contain_text("1 face", timeout=2000)
 
         # Now draw a diagonal from A to C
         page.keyboard.press("l")
-        time.sleep(0.3)
-
-        # Click on top-left corner (A)
-        page.mouse.click(center_x - 60, center_y - 40)
-        time.sleep(0.3)
 
-        # Click on bottom-right corner (C)
-        page.mouse.move(center_x + 60, center_y + 40)
-        time.sleep(0.1)
-        page.mouse.click(center_x + 60, center_y + 40)
-        time.sleep(0.3)
+        # Click top-left corner (A), then bottom-right corner (C)
+        _draw_polyline(page, [
+            (center_x - 60, center_y - 40),
+            (center_x + 60, center_y + 40),
+        ])
 
         page.keyboard.press("Escape")
-        time.sleep(0.3)
 
-        page.screenshot(path="/results/11_rectangle_with_diagonal.png")
+        self.final_screenshot(page, "11_rectangle_with_diagonal")
 
         # Check that we now have 2 faces (the diagonal splits the rectangle)
-        faces_status = page.locator("text=/\\d+ faces/")
-        status_text = faces_status.text_content()
+        status_text = self.faces_status.text_content()
         print(f"Faces status after diagonal: {status_text}")
 
         # Should have 2 faces now
-        expect(faces_status).to_contain_text("2 faces")
+        expect(self.faces_status).to_contain_text("2 faces")
 
     def test_camera_orbit(self, page: Page):
         """Test that camera orbit works with select tool."""
-        canvas = page.locator("canvas").first
-        box = canvas.bounding_box()
-        assert box is not None
-
-        center_x = box["x"] + box["width"] / 2
-        center_y = box["y"] + box["height"] / 2
+        center_x, center_y = self.canvas_center
 
         # Make sure we're in select mode (orbit enabled)
         page.keyboard.press("v")
-        time.sleep(0.3)
-
-        # Take before screenshot
-        page.screenshot(path="/results/06_before_orbit.png")
 
         # Drag to orbit camera
         page.mouse.move(center_x, center_y)
         page.mouse.down()
         page.mouse.move(center_x + 100, center_y - 50, steps=10)
         page.mouse.up()
-        time.sleep(0.5)
 
-        # Take after screenshot
-        page.screenshot(path="/results/07_after_orbit.png")
+        self.final_screenshot(page, "07_after_orbit")
 
     def test_grid_snap_toggle(self, page: Page):
         """Test that grid snap can be toggled."""
@@ -267,251 +260,142 @@ class TestCADEditor:
 
         # Click to toggle
         snap_button.click()
-        time.sleep(0.3)
 
-        page.screenshot(path="/results/08_snap_toggled.png")
+        self.final_screenshot(page, "08_snap_toggled")
 
     def test_clear_scene(self, page: Page):
-        """Test clearing the scene."""
+        """Test clearing the scene through the store."""
         # First draw something
-        canvas = page.locator("canvas").first
-        box = canvas.bounding_box()
-        assert box is not None
+        center_x, center_y = self.canvas_center
+
+        page.keyboard.press("l")
+        _draw_polyline(page, [(center_x, center_y), (center_x + 50, center_y)])
+        page.keyboard.press("Escape")
 
-        center_x = box["x"] + box["width"] / 2
-        center_y = box["y"] + box["height"] / 2
+        page.evaluate("() => window.__poche.clear()")
+
+        self.final_screenshot(page, "09_scene_cleared")
+
+        assert page.evaluate("() => window.__poche().vertexCount") == 0
+
+    def test_clear_button(self, page: Page):
+        """Test that the toolbar's clear button empties the scene."""
+        center_x, center_y = self.canvas_center
 
         page.keyboard.press("l")
-        time.sleep(0.2)
-        page.mouse.click(center_x, center_y)
-        time.sleep(0.2)
-        page.mouse.click(center_x + 50, center_y)
-        time.sleep(0.2)
+        _draw_polyline(page, [(center_x, center_y), (center_x + 50, center_y)])
         page.keyboard.press("Escape")
-        time.sleep(0.3)
 
-        # Find and click clear button (trash icon)
-        clear_button = page.locator("button").filter(has=page.locator("svg")).last
-        clear_button.click()
-        time.sleep(0.3)
+        page.get_by_title("Clear Scene (⇧C)").click()
 
-        page.screenshot(path="/results/09_scene_cleared.png")
+        expect(self.vertices_status).to_contain_text("0 vertices")
 
     def test_rectangle_tool(self, page: Page):
         """Test the rectangle drawing tool."""
-        canvas = page.locator("canvas").first
-        box = canvas.bounding_box()
-        assert box is not None
-
-        center_x = box["x"] + box["width"] / 2
-        center_y = box["y"] + box["height"] / 2
+        center_x, center_y = self.canvas_center
 
         # Activate rectangle tool with 'R'
         page.keyboard.press("r")
-        time.sleep(0.5)
-
-        page.screenshot(path="/results/12_rectangle_tool_active.png")
 
         # Click first corner - use larger Y offsets to ensure Z variation in world space
         # With isometric camera, Y screen movement translates to Z world movement
         first_x, first_y = center_x - 100, center_y - 150
         print(f"Clicking first corner at ({first_x}, {first_y})...")
         page.mouse.click(first_x, first_y)
-        time.sleep(0.3)
-
-        page.screenshot(path="/results/13_rectangle_first_corner.png")
 
         # Move to opposite corner for preview - larger offset to ensure non-zero Z
         second_x, second_y = center_x + 100, center_y + 150
         print(f"Moving to ({second_x}, {second_y}) for preview...")
         page.mouse.move(second_x, second_y)
-        time.sleep(0.5)
-
-        # Take screenshot of preview
-        page.screenshot(path="/results/14_rectangle_preview.png")
 
         # Click to complete rectangle
         print(f"Clicking second corner at ({second_x}, {second_y})...")
         page.mouse.click(second_x, second_y)
-        time.sleep(0.5)
 
-        page.screenshot(path="/results/15_rectangle_complete.png")
+        self.final_screenshot(page, "15_rectangle_complete")
 
         # Check that geometry was created (4 vertices, 4 edges, 1 face)
-        vertices_status = page.locator("text=/\\d+ vertices/")
-        edges_status = page.locator("text=/\\d+ edges/")
-        faces_status = page.locator("text=/\\d+ faces/")
+        page.wait_for_function("() => window.__poche().vertexCount === 4", timeout=2000)
+        counts = _scene_counts(page)
+        print(f"Rectangle created: {counts}")
 
-        expect(vertices_status).to_be_visible()
-        expect(edges_status).to_be_visible()
-        expect(faces_status).to_be_visible()
-
-        vertices_text = vertices_status.text_content()
-        edges_text = edges_status.text_content()
-        faces_text = faces_status.text_content()
-
-        print(f"Rectangle created: {vertices_text}, {edges_text}, {faces_text}")
-
-        # Should have 4 vertices
-        expect(vertices_status).to_contain_text("4 vertices")
-        # Should have 4 edges
-        expect(edges_status).to_contain_text("4 edges")
-        # Should have 1 face
-        expect(faces_status).to_contain_text("1 face")
+        assert counts == {"vertices": 4, "edges": 4, "faces": 1}
 
     def test_rectangle_cancel(self, page: Page):
         """Test cancelling rectangle drawing with Escape."""
-        canvas = page.locator("canvas").first
-        box = canvas.bounding_box()
-        assert box is not None
-
-        center_x = box["x"] + box["width"] / 2
-        center_y = box["y"] + box["height"] / 2
+        center_x, center_y = self.canvas_center
 
         # Activate rectangle tool
         page.keyboard.press("r")
-        time.sleep(0.3)
 
         # Click first corner
         page.mouse.click(center_x - 50, center_y - 30)
-        time.sleep(0.3)
 
         # Move to show preview
         page.mouse.move(center_x + 50, center_y + 30)
-        time.sleep(0.3)
-
-        page.screenshot(path="/results/16_rectangle_before_cancel.png")
 
         # Press Escape to cancel
         page.keyboard.press("Escape")
-        time.sleep(0.3)
 
-        page.screenshot(path="/results/17_rectangle_after_cancel.png")
+        self.final_screenshot(page, "17_rectangle_after_cancel")
 
         # Check that no geometry was created
-        vertices_status = page.locator("text=/\\d+ vertices/")
-        vertices_text = vertices_status.text_content()
+        vertices_text = self.vertices_status.text_content()
         print(f"Vertices after cancel: {vertices_text}")
 
         # Should have 0 vertices
-        expect(vertices_status).to_contain_text("0 vertices")
+        expect(self.vertices_status).to_contain_text("0 vertices")
 
     def test_circle_tool(self, page: Page):
         """Test the circle drawing tool."""
-        canvas = page.locator("canvas").first
-        box = canvas.bounding_box()
-        assert box is not None
-
-        center_x = box["x"] + box["width"] / 2
-        center_y = box["y"] + box["height"] / 2
+        center_x, center_y = self.canvas_center
 
         # Activate circle tool with 'C'
         page.keyboard.press("c")
-        time.sleep(0.5)
-
-        page.screenshot(path="/results/18_circle_tool_active.png")
 
         # Click to place center
         print(f"Clicking center at ({center_x}, {center_y})...")
         page.mouse.click(center_x, center_y)
-        time.sleep(0.3)
-
-        page.screenshot(path="/results/19_circle_center.png")
 
         # Move to set radius (100 pixels away)
         radius_x, radius_y = center_x + 100, center_y
         print(f"Moving to ({radius_x}, {radius_y}) to set radius...")
         page.mouse.move(radius_x, radius_y)
-        time.sleep(0.5)
-
-        # Take screenshot of preview
-        page.screenshot(path="/results/20_circle_preview.png")
 
         # Click to complete circle
         print(f"Clicking to complete circle...")
         page.mouse.click(radius_x, radius_y)
-        time.sleep(0.5)
 
-        page.screenshot(path="/results/21_circle_complete.png")
+        self.final_screenshot(page, "21_circle_complete")
 
         # Check that geometry was created (24 vertices, 24 edges, 1 face)
-        vertices_status = page.locator("text=/\\d+ vertices/")
-        edges_status = page.locator("text=/\\d+ edges/")
-        faces_status = page.locator("text=/\\d+ faces/")
-
-        expect(vertices_status).to_be_visible()
-        expect(edges_status).to_be_visible()
-        expect(faces_status).to_be_visible()
-
-        vertices_text = vertices_status.text_content()
-        edges_text = edges_status.text_content()
-        faces_text = faces_status.text_content()
+        page.wait_for_function("() => window.__poche().vertexCount === 24", timeout=2000)
+        counts = _scene_counts(page)
+        print(f"Circle created: {counts}")
 
-        print(f"Circle created: {vertices_text}, {edges_text}, {faces_text}")
-
-        # Should have 24 vertices (polygon approximation)
-        expect(vertices_status).to_contain_text("24 vertices")
-        # Should have 24 edges
-        expect(edges_status).to_contain_text("24 edges")
-        # Should have 1 face
-        expect(faces_status).to_contain_text("1 face")
+        assert counts == {"vertices": 24, "edges": 24, "faces": 1}
 
     def test_vertical_wall_rectangle(self, page: Page):
         """Test drawing a vertical wall with the rectangle tool."""
-        canvas = page.locator("canvas").first
-        box = canvas.bounding_box()
-        assert box is not None
-
-        center_x = box["x"] + box["width"] / 2
-        center_y = box["y"] + box["height"] / 2
+        center_x, center_y = self.canvas_center
 
         # Activate rectangle tool with 'R'
         page.keyboard.press("r")
-        time.sleep(0.5)
 
-        # Click to place first corner at ground level
+        # First corner at ground level
         first_x, first_y = center_x - 100, center_y + 50
-        print(f"Clicking first corner at ({first_x}, {first_y})...")
-        page.mouse.click(first_x, first_y)
-        time.sleep(0.3)
-
-        page.screenshot(path="/results/22_wall_first_corner.png")
 
         # Move UP on screen (negative Y) to create height, and right for width
         # This should create a vertical wall
         second_x, second_y = center_x + 100, center_y - 150  # Move up significantly
-        print(f"Moving to ({second_x}, {second_y}) for vertical wall...")
-        page.mouse.move(second_x, second_y)
-        time.sleep(0.5)
+        print(f"Drawing wall from ({first_x}, {first_y}) to ({second_x}, {second_y})...")
+        _draw_polyline(page, [(first_x, first_y), (second_x, second_y)])
 
-        # Take screenshot of preview
-        page.screenshot(path="/results/23_wall_preview.png")
-
-        # Click to complete wall
-        print(f"Clicking to complete wall...")
-        page.mouse.click(second_x, second_y)
-        time.sleep(0.5)
-
-        page.screenshot(path="/results/24_wall_complete.png")
+        self.final_screenshot(page, "24_wall_complete")
 
         # Check that geometry was created
-        vertices_status = page.locator("text=/\\d+ vertices/")
-        edges_status = page.locator("text=/\\d+ edges/")
-        faces_status = page.locator("text=/\\d+ faces/")
-
-        expect(vertices_status).to_be_visible()
-        expect(edges_status).to_be_visible()
-        expect(faces_status).to_be_visible()
-
-        vertices_text = vertices_status.text_content()
-        edges_text = edges_status.text_content()
-        faces_text = faces_status.text_content()
-
-        print(f"Wall created: {vertices_text}, {edges_text}, {faces_text}")
-
-        # Should have 4 vertices
-        expect(vertices_status).to_contain_text("4 vertices")
-        # Should have 4 edges
-        expect(edges_status).to_contain_text("4 edges")
-        # Should have 1 face
-        expect(faces_status).to_contain_text("1 face")
+        page.wait_for_function("() => window.__poche().vertexCount === 4", timeout=2000)
+        counts = _scene_counts(page)
+        print(f"Wall created: {counts}")
+
+        assert counts == {"vertices": 4, "edges": 4, "faces": 1}